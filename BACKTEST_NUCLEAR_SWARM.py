@@ -14,15 +14,149 @@ Goal: Validate 6.39% daily return = 474% monthly
 
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from multiprocessing import Pool
 import logging
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Side codes drawn in the hot path index into this table
+SIDE_LUT = ('long', 'short')
+
+# Row layout of the optional trade log (see NuclearSwarmBacktest.record_trades)
+TRADE_DTYPE = np.dtype([
+    ('strategy_idx', np.int64),
+    ('symbol_idx', np.int64),
+    ('timeframe_idx', np.int64),
+    ('side', np.int8),
+    ('confidence', np.float64),
+    ('position_capital', np.float64),
+    ('leverage', np.float64),
+    ('is_win', np.bool_),
+    ('gross_pnl', np.float64),
+    ('fees', np.float64),
+    ('slippage', np.float64),
+    ('net_pnl', np.float64)
+])
+
 
 @dataclass
+class StrategyParamsSoA:
+    """Strategy parameters as parallel arrays indexed by strategy_idx"""
+    names: List[str]
+    target_daily: np.ndarray
+    trades_per_day: np.ndarray
+    win_rate: np.ndarray
+    avg_win: np.ndarray
+    avg_loss: np.ndarray
+    leverage: np.ndarray
+    position_size: np.ndarray
+    timeframes: List[List[str]]
+
+    @classmethod
+    def from_dict(cls, strategies: Dict) -> 'StrategyParamsSoA':
+        """Build from a {name: params} strategy dict"""
+        params = list(strategies.values())
+
+        def column(key: str) -> np.ndarray:
+            return np.array([p[key] for p in params], dtype=np.float64)
+
+        return cls(
+            names=list(strategies.keys()),
+            target_daily=column('target_daily'),
+            trades_per_day=column('trades_per_day'),
+            win_rate=column('win_rate'),
+            avg_win=column('avg_win'),
+            avg_loss=column('avg_loss'),
+            leverage=column('leverage'),
+            position_size=column('position_size'),
+            timeframes=[list(p['timeframes']) for p in params]
+        )
+
+
+def _default_symbols() -> List[str]:
+    """Default 20-symbol trading universe"""
+    return [
+        'BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'BNB/USDT',
+        'ARB/USDT', 'MATIC/USDT', 'AVAX/USDT', 'LINK/USDT',
+        'UNI/USDT', 'ATOM/USDT', 'DOT/USDT', 'ADA/USDT',
+        'XRP/USDT', 'DOGE/USDT', 'LTC/USDT', 'BCH/USDT',
+        'ETC/USDT', 'FIL/USDT', 'NEAR/USDT', 'APT/USDT'
+    ]
+
+
+def _default_strategies() -> Dict:
+    """Default parameters for the 5 swarm strategies"""
+    return {
+        'hf_scalping': {
+            'target_daily': 0.025,
+            'trades_per_day': 15,
+            'win_rate': 0.72,
+            'avg_win': 0.0025,
+            'avg_loss': 0.0015,
+            'leverage': 20,
+            'position_size': 0.10,
+            'timeframes': ['1m', '3m', '5m']
+        },
+        'momentum': {
+            'target_daily': 0.020,
+            'trades_per_day': 4,
+            'win_rate': 0.65,
+            'avg_win': 0.012,
+            'avg_loss': 0.006,
+            'leverage': 15,
+            'position_size': 0.15,
+            'timeframes': ['15m', '30m', '1h']
+        },
+        'stat_arb': {
+            'target_daily': 0.010,
+            'trades_per_day': 3,
+            'win_rate': 0.69,
+            'avg_win': 0.008,
+            'avg_loss': 0.004,
+            'leverage': 12,
+            'position_size': 0.12,
+            'timeframes': ['15m', '1h', '4h']
+        },
+        'funding_arb': {
+            'target_daily': 0.005,
+            'trades_per_day': 1,
+            'win_rate': 0.95,
+            'avg_win': 0.0005,
+            'avg_loss': 0.0002,
+            'leverage': 10,
+            'position_size': 0.20,
+            'timeframes': ['8h']
+        },
+        'grid': {
+            'target_daily': 0.008,
+            'trades_per_day': 8,
+            'win_rate': 0.78,
+            'avg_win': 0.0018,
+            'avg_loss': 0.0012,
+            'leverage': 8,
+            'position_size': 0.08,
+            'timeframes': ['5m', '15m']
+        }
+    }
+
+
+@dataclass(slots=True)
 class BacktestConfig:
     """Backtest configuration"""
     initial_capital: float = 500
@@ -35,7 +169,7 @@ class BacktestConfig:
     max_position_size_pct: float = 0.02   # 2.0%
 
     # Symbols
-    symbols: List[str] = None
+    symbols: List[str] = field(default_factory=_default_symbols)
 
     # Fees & slippage
     maker_fee: float = 0.0002  # 0.02%
@@ -43,71 +177,173 @@ class BacktestConfig:
     slippage: float = 0.0003   # 0.03%
 
     # Strategy parameters
-    strategies: Dict = None
+    strategies: Dict = field(default_factory=_default_strategies)
+
+    # Random number generator seed (PCG64)
+    seed: int = 42
+
+    # Derived from `strategies` in refresh_strategy_arrays()
+    soa: StrategyParamsSoA = field(init=False, repr=False, compare=False)
+    _score_base: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if self.symbols is None:
-            self.symbols = [
-                'BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'BNB/USDT',
-                'ARB/USDT', 'MATIC/USDT', 'AVAX/USDT', 'LINK/USDT',
-                'UNI/USDT', 'ATOM/USDT', 'DOT/USDT', 'ADA/USDT',
-                'XRP/USDT', 'DOGE/USDT', 'LTC/USDT', 'BCH/USDT',
-                'ETC/USDT', 'FIL/USDT', 'NEAR/USDT', 'APT/USDT'
-            ]
-
-        if self.strategies is None:
-            self.strategies = {
-                'hf_scalping': {
-                    'target_daily': 0.025,
-                    'trades_per_day': 15,
-                    'win_rate': 0.72,
-                    'avg_win': 0.0025,
-                    'avg_loss': 0.0015,
-                    'leverage': 20,
-                    'position_size': 0.10,
-                    'timeframes': ['1m', '3m', '5m']
-                },
-                'momentum': {
-                    'target_daily': 0.020,
-                    'trades_per_day': 4,
-                    'win_rate': 0.65,
-                    'avg_win': 0.012,
-                    'avg_loss': 0.006,
-                    'leverage': 15,
-                    'position_size': 0.15,
-                    'timeframes': ['15m', '30m', '1h']
-                },
-                'stat_arb': {
-                    'target_daily': 0.010,
-                    'trades_per_day': 3,
-                    'win_rate': 0.69,
-                    'avg_win': 0.008,
-                    'avg_loss': 0.004,
-                    'leverage': 12,
-                    'position_size': 0.12,
-                    'timeframes': ['15m', '1h', '4h']
-                },
-                'funding_arb': {
-                    'target_daily': 0.005,
-                    'trades_per_day': 1,
-                    'win_rate': 0.95,
-                    'avg_win': 0.0005,
-                    'avg_loss': 0.0002,
-                    'leverage': 10,
-                    'position_size': 0.20,
-                    'timeframes': ['8h']
-                },
-                'grid': {
-                    'target_daily': 0.008,
-                    'trades_per_day': 8,
-                    'win_rate': 0.78,
-                    'avg_win': 0.0018,
-                    'avg_loss': 0.0012,
-                    'leverage': 8,
-                    'position_size': 0.08,
-                    'timeframes': ['5m', '15m']
-                }
-            }
+        self.refresh_strategy_arrays()
+
+    def refresh_strategy_arrays(self):
+        """Rebuild the array views after `strategies` is replaced"""
+        # Array view of the strategies for the hot paths; the dict stays for display
+        self.soa = StrategyParamsSoA.from_dict(self.strategies)
+
+        # Confidence-independent part of the opportunity score, per strategy
+        self._score_base = (
+            np.minimum(1.0, self.soa.avg_win / 0.02) * 0.4 +
+            (1 - self.soa.avg_loss / self.soa.avg_win) * 0.2
+        )
+
+
+@lru_cache(maxsize=None)
+def _specialized_day_kernel(n_strategies: int, max_new_per_scan: int):
+    """
+    Build the compiled day kernel with the problem geometry frozen in
+
+    numba treats closure variables as compile-time constants, so the
+    strategy count and per-scan top-k size are folded into the machine
+    code (one compiled and disk-cached specialization per geometry).
+    """
+    @njit(cache=True, fastmath=True)
+    def _simulate_day_kernel(rng, n_scans, combo_strategy_idx, combo_symbol_idx,
+                             combo_timeframe_idx, combo_signal_prob, score_base,
+                             win_rates, avg_wins, avg_losses, leverages,
+                             min_size_pct, max_size_pct, taker_fee, slippage, cost_per_unit,
+                             max_positions, active_positions,
+                             current_capital, peak_capital,
+                             record, trade_log, n_recorded):
+        """
+        Compiled scan loop for one simulated day
+
+        Scans every combo, keeps the best `max_new_per_scan` signals with an
+        in-place insertion sort and executes them against the running capital.
+        Random draws are taken in the same order as _simulate_scans_vectorized
+        (the day's scan × combo signal matrix, then per scan the confidences
+        and sides of its signals, then the win and P&L draws of the trades
+        taken), so a seed gives the same backtest with or without numba.
+
+        With `record` set, each trade is written as a TRADE_DTYPE row into
+        `trade_log` from index `n_recorded` on; the caller preallocates room
+        for n_scans * max_new_per_scan rows.
+
+        Returns: (capital, peak_capital, active_positions, trades, wins, fees,
+                  per-strategy trades, per-strategy wins, per-strategy pnl)
+        """
+        n_combos = combo_strategy_idx.shape[0]
+        strategy_trades = np.zeros(n_strategies, dtype=np.int64)
+        strategy_wins = np.zeros(n_strategies, dtype=np.int64)
+        strategy_pnl = np.zeros(n_strategies, dtype=np.float64)
+        signal_combo = np.empty(n_combos, dtype=np.int64)
+        signal_conf = np.empty(n_combos, dtype=np.float64)
+        signal_side = np.empty(n_combos, dtype=np.int64)
+        top_scores = np.empty(max_new_per_scan, dtype=np.float64)
+        top_signal = np.empty(max_new_per_scan, dtype=np.int64)
+        win_u = np.empty(max_new_per_scan, dtype=np.float64)
+        pnl_mult = np.empty(max_new_per_scan, dtype=np.float64)
+
+        capital = current_capital
+        total_trades = 0
+        total_wins = 0
+        total_fees = 0.0
+        size_range = max_size_pct - min_size_pct
+
+        # Signal draws for the whole day up front, row-major like rng.random((scans, combos))
+        signal_u = np.empty((n_scans, n_combos), dtype=np.float64)
+        for scan in range(n_scans):
+            for c in range(n_combos):
+                signal_u[scan, c] = rng.random()
+
+        for scan in range(n_scans):
+            slots = min(max_new_per_scan, max_positions - active_positions)
+            if slots <= 0:
+                # No free slots: skip signal generation, just let positions close
+                active_positions -= int(active_positions * 0.2)
+                continue
+
+            n_signals = 0
+            for c in range(n_combos):
+                if signal_u[scan, c] < combo_signal_prob[c]:
+                    signal_combo[n_signals] = c
+                    n_signals += 1
+            for i in range(n_signals):
+                signal_conf[i] = rng.uniform(0.65, 0.95)
+            for i in range(n_signals):
+                signal_side[i] = rng.integers(0, 2)
+
+            # Top-k selection, best score first
+            n_top = 0
+            for i in range(n_signals):
+                score = signal_conf[i] * 0.4 + score_base[combo_strategy_idx[signal_combo[i]]]
+                if n_top < slots:
+                    pos = n_top
+                    n_top += 1
+                elif score > top_scores[n_top - 1]:
+                    pos = n_top - 1
+                else:
+                    continue
+                while pos > 0 and top_scores[pos - 1] < score:
+                    top_scores[pos] = top_scores[pos - 1]
+                    top_signal[pos] = top_signal[pos - 1]
+                    pos -= 1
+                top_scores[pos] = score
+                top_signal[pos] = i
+
+            # Execute selected opportunities
+            for j in range(n_top):
+                win_u[j] = rng.random()
+            for j in range(n_top):
+                pnl_mult[j] = rng.uniform(0.8, 1.2)
+            for j in range(n_top):
+                s = combo_strategy_idx[signal_combo[top_signal[j]]]
+                position_capital = capital * (min_size_pct + top_scores[j] * size_range)
+                leveraged_position = position_capital * leverages[s]
+                if win_u[j] < win_rates[s]:
+                    gross_pnl_pct = avg_wins[s] * pnl_mult[j]
+                    total_wins += 1
+                    strategy_wins[s] += 1
+                else:
+                    gross_pnl_pct = -avg_losses[s] * pnl_mult[j]
+                net_pnl = leveraged_position * (gross_pnl_pct - cost_per_unit)
+
+                if record:
+                    i = top_signal[j]
+                    c = signal_combo[i]
+                    row = trade_log[n_recorded + total_trades]
+                    row.strategy_idx = s
+                    row.symbol_idx = combo_symbol_idx[c]
+                    row.timeframe_idx = combo_timeframe_idx[c]
+                    row.side = signal_side[i]
+                    row.confidence = signal_conf[i]
+                    row.position_capital = position_capital
+                    row.leverage = leverages[s]
+                    row.is_win = win_u[j] < win_rates[s]
+                    row.gross_pnl = leveraged_position * gross_pnl_pct
+                    row.fees = leveraged_position * 2.0 * taker_fee
+                    row.slippage = leveraged_position * 2.0 * slippage
+                    row.net_pnl = net_pnl
+
+                capital += net_pnl
+                if capital > peak_capital:
+                    peak_capital = capital
+                total_trades += 1
+                total_fees += leveraged_position * 2.0 * taker_fee
+                strategy_trades[s] += 1
+                strategy_pnl[s] += net_pnl
+
+            # Assume ~20% of positions close each scan
+            active_positions += n_top
+            active_positions -= int(active_positions * 0.2)
+
+        return (capital, peak_capital, active_positions, total_trades, total_wins, total_fees,
+                strategy_trades, strategy_wins, strategy_pnl)
+
+    return _simulate_day_kernel
 
 
 class NuclearSwarmBacktest:
@@ -122,7 +358,9 @@ class NuclearSwarmBacktest:
     - Circuit breakers
     """
 
-    def __init__(self, config: BacktestConfig):
+    def __init__(self, config: BacktestConfig, record_trades: bool = False):
+        # Callers may swap config.strategies after construction (see BACKTEST_OPTIMIZED)
+        config.refresh_strategy_arrays()
         self.config = config
         self.initial_capital = config.initial_capital
         self.current_capital = config.initial_capital
@@ -137,24 +375,83 @@ class NuclearSwarmBacktest:
         self.total_fees = 0.0
 
         # Position tracking
-        self.active_positions = []
-
-        # Results by strategy
-        self.strategy_performance = {
-            strategy: {
-                'trades': 0,
-                'wins': 0,
-                'losses': 0,
-                'pnl': 0.0
-            }
-            for strategy in config.strategies.keys()
-        }
+        self.active_position_count = 0
+
+        # Flatten strategy × symbol × timeframe into parallel combo arrays
+        soa = config.soa
+        self.strategy_names = soa.names
+        n_symbols = len(config.symbols)
+
+        # (strategy_idx, timeframe_idx) pairs; timeframe strings stay in soa.timeframes
+        self._combo_table = np.array([
+            (strategy_idx, timeframe_idx)
+            for strategy_idx, timeframes in enumerate(soa.timeframes)
+            for timeframe_idx in range(len(timeframes))
+        ], dtype=np.int64).reshape(-1, 2)
+
+        # Combo order is strategy, then symbol, then timeframe
+        combos = np.array([
+            (pair_idx, symbol_idx)
+            for strategy_idx in range(len(soa.names))
+            for symbol_idx in range(n_symbols)
+            for pair_idx in np.flatnonzero(self._combo_table[:, 0] == strategy_idx)
+        ], dtype=np.int64).reshape(-1, 2)
+        self.combo_strategy_idx = self._combo_table[combos[:, 0], 0]
+        self.combo_timeframe_idx = self._combo_table[combos[:, 0], 1]
+        self.combo_symbol_idx = np.ascontiguousarray(combos[:, 1])
+        self.n_combos = len(self.combo_strategy_idx)
+
+        # Signal probability per scan: trades_per_day over 100 scans, spread across symbols
+        signal_prob = soa.trades_per_day / 100.0 / n_symbols
+        self.combo_signal_prob = signal_prob[self.combo_strategy_idx]
+
+        # Round-trip taker fees plus slippage on both sides, per unit of leveraged position
+        self._cost_per_unit = 2 * config.taker_fee + 2 * config.slippage
+
+        self.rng = np.random.default_rng(config.seed)
+
+        # Results by strategy (parallel arrays indexed by strategy_idx)
+        n_strategies = len(self.strategy_names)
+        self._perf_trades = np.zeros(n_strategies, dtype=np.int64)
+        self._perf_wins = np.zeros(n_strategies, dtype=np.int64)
+        self._perf_losses = np.zeros(n_strategies, dtype=np.int64)
+        self._perf_pnl = np.zeros(n_strategies, dtype=np.float64)
+
+        # Per-trade log, off by default (aggregate stats don't need it)
+        self.record_trades = record_trades
+        self._trade_log = np.empty(1024 if record_trades else 0, dtype=TRADE_DTYPE)
+        self._n_recorded = 0
 
         logger.info(f"🔬 Backtest initialized: {config.start_date.date()} to {config.end_date.date()}")
         logger.info(f"   Symbols: {len(config.symbols)}")
         logger.info(f"   Strategies: {len(config.strategies)}")
         logger.info(f"   Initial Capital: ${config.initial_capital:,.2f}")
 
+    @property
+    def strategy_performance(self) -> Dict[str, Dict]:
+        """Per-strategy trades/wins/losses/pnl keyed by strategy name"""
+        return {
+            strategy: {
+                'trades': int(trades),
+                'wins': int(wins),
+                'losses': int(losses),
+                'pnl': float(pnl)
+            }
+            for strategy, trades, wins, losses, pnl in zip(
+                self.strategy_names, self._perf_trades, self._perf_wins,
+                self._perf_losses, self._perf_pnl
+            )
+        }
+
+    @property
+    def trade_log(self) -> np.ndarray:
+        """Recorded trades as a TRADE_DTYPE structured array (empty unless record_trades)"""
+        return self._trade_log[:self._n_recorded]
+
+    def timeframe_name(self, strategy_idx: int, timeframe_idx: int) -> str:
+        """Map a (strategy_idx, timeframe_idx) pair back to its timeframe string"""
+        return self.config.soa.timeframes[strategy_idx][timeframe_idx]
+
     def calculate_total_combinations(self) -> int:
         """Calculate total strategy × symbol × timeframe combinations"""
         total = 0
@@ -162,121 +459,189 @@ class NuclearSwarmBacktest:
             total += len(self.config.symbols) * len(params['timeframes'])
         return total
 
-    def simulate_signal_generation(self, strategy: str, symbol: str, timeframe: str) -> Tuple[bool, float, str]:
-        """
-        Simulate signal generation for a strategy
+    def calculate_opportunity_score(self, strategy_idx, confidence):
+        """Calculate opportunity score for ranking (scalar or array inputs)"""
+        return confidence * 0.4 + self.config._score_base[strategy_idx]
 
-        Returns: (has_signal, confidence, side)
+    def execute_trades_batch(self, strategy_idx: np.ndarray, symbol_idx: np.ndarray,
+                             confidences: np.ndarray, sides: np.ndarray,
+                             timeframe_idx: Optional[np.ndarray] = None):
         """
-        params = self.config.strategies[strategy]
-
-        # Signal probability based on trades per day
-        signals_per_day = params['trades_per_day']
-        # Assume 100 scans per day, so probability = signals_per_day / 100
-        signal_prob = signals_per_day / 100.0
-
-        # Across 20 symbols, adjust probability
-        signal_prob = signal_prob / len(self.config.symbols)
-
-        if np.random.random() > signal_prob:
-            return False, 0.0, 'long'
-
-        # Generate signal
-        confidence = np.random.uniform(0.65, 0.95)
-        side = np.random.choice(['long', 'short'])
+        Simulate execution of a batch of trades taken in the same scan
 
-        return True, confidence, side
-
-    def calculate_opportunity_score(self, strategy: str, confidence: float) -> float:
-        """Calculate opportunity score for ranking"""
-        params = self.config.strategies[strategy]
-
-        expected_return = params['avg_win']
-        risk = params['avg_loss'] / params['avg_win']
-
-        score = (
-            confidence * 0.4 +
-            min(1.0, expected_return / 0.02) * 0.4 +
-            (1 - risk) * 0.2
-        )
-
-        return score
-
-    def execute_trade(self, strategy: str, symbol: str, confidence: float, side: str) -> Dict:
+        Trades are filled in array order; each one is sized off the capital
+        left by the trades before it. Sides are integer codes into SIDE_LUT.
+        Only aggregate stats are updated unless record_trades is on.
         """
-        Simulate trade execution
-
-        Returns: Trade result
-        """
-        params = self.config.strategies[strategy]
+        n = len(strategy_idx)
+        min_size_pct = self.config.min_position_size_pct
+        max_size_pct = self.config.max_position_size_pct
+        taker_fee = self.config.taker_fee
+        slippage = self.config.slippage
+        soa = self.config.soa
+        avg_win = soa.avg_win[strategy_idx]
+        avg_loss = soa.avg_loss[strategy_idx]
+        leverage = soa.leverage[strategy_idx]
 
         # Calculate position size based on opportunity score
-        score = self.calculate_opportunity_score(strategy, confidence)
-        base_size = self.config.min_position_size_pct
-        bonus_size = score * (self.config.max_position_size_pct - self.config.min_position_size_pct)
-        position_size_pct = base_size + bonus_size
-
-        # Calculate capital allocation
-        position_capital = self.current_capital * position_size_pct
-        leveraged_position = position_capital * params['leverage']
+        scores = self.calculate_opportunity_score(strategy_idx, confidences)
+        position_size_pct = min_size_pct + scores * (max_size_pct - min_size_pct)
 
         # Simulate outcome based on win rate
-        is_win = np.random.random() < params['win_rate']
-
-        if is_win:
-            # Winning trade
-            gross_pnl_pct = params['avg_win'] * np.random.uniform(0.8, 1.2)
-        else:
-            # Losing trade
-            gross_pnl_pct = -params['avg_loss'] * np.random.uniform(0.8, 1.2)
-
-        # Calculate dollar P&L
-        gross_pnl = leveraged_position * gross_pnl_pct
+        is_win = self.rng.random(n) < soa.win_rate[strategy_idx]
+        pnl_mult = self.rng.uniform(0.8, 1.2, n)
+        gross_pnl_pct = np.where(is_win, avg_win * pnl_mult, -avg_loss * pnl_mult)
 
-        # Fees (entry + exit)
-        entry_fee = leveraged_position * self.config.taker_fee
-        exit_fee = leveraged_position * self.config.taker_fee
+        # Fees (entry + exit) and slippage (both sides), as a fraction of the leveraged position
+        net_pnl_pct = np.subtract(gross_pnl_pct, self._cost_per_unit, out=gross_pnl_pct)
 
-        # Slippage
-        slippage_cost = leveraged_position * self.config.slippage * 2  # Both sides
+        # Capital compounds trade by trade, so fold it with a running product
+        exposure = position_size_pct * leverage
+        capital_after = self.current_capital * np.cumprod(1 + exposure * net_pnl_pct)
+        capital_before = np.concatenate(([self.current_capital], capital_after[:-1]))
 
-        # Net P&L
-        net_pnl = gross_pnl - entry_fee - exit_fee - slippage_cost
+        position_capital = capital_before * position_size_pct
+        leveraged_position = position_capital * leverage
+        net_pnl = leveraged_position * net_pnl_pct
 
         # Update capital
-        self.current_capital += net_pnl
+        if n:
+            self.current_capital = float(capital_after[-1])
+            self.peak_capital = max(self.peak_capital, float(capital_after.max()))
 
         # Update tracking
-        self.total_trades += 1
-        self.total_fees += entry_fee + exit_fee
-
-        if is_win:
-            self.winning_trades += 1
-            self.strategy_performance[strategy]['wins'] += 1
-        else:
-            self.losing_trades += 1
-            self.strategy_performance[strategy]['losses'] += 1
+        n_wins = int(is_win.sum())
+        self.total_trades += n
+        self.winning_trades += n_wins
+        self.losing_trades += n - n_wins
+        self.total_fees += float(leveraged_position.sum()) * (taker_fee * 2)
+
+        np.add.at(self._perf_trades, strategy_idx, 1)
+        np.add.at(self._perf_wins, strategy_idx[is_win], 1)
+        np.add.at(self._perf_losses, strategy_idx[~is_win], 1)
+        np.add.at(self._perf_pnl, strategy_idx, net_pnl)
+
+        if not self.record_trades:
+            return
+
+        start = self._n_recorded
+        end = start + n
+        self._reserve_trade_log(n)
+
+        fees = leveraged_position * (taker_fee * 2)
+        slippage_cost = leveraged_position * (slippage * 2)
+        rows = self._trade_log[start:end]
+        rows['strategy_idx'] = strategy_idx
+        rows['symbol_idx'] = symbol_idx
+        rows['timeframe_idx'] = -1 if timeframe_idx is None else timeframe_idx
+        rows['side'] = sides
+        rows['confidence'] = confidences
+        rows['position_capital'] = position_capital
+        rows['leverage'] = leverage
+        rows['is_win'] = is_win
+        rows['gross_pnl'] = net_pnl + fees + slippage_cost
+        rows['fees'] = fees
+        rows['slippage'] = slippage_cost
+        rows['net_pnl'] = net_pnl
+        self._n_recorded = end
+
+    def _reserve_trade_log(self, n: int):
+        """Grow the trade log so `n` more rows fit after the recorded ones"""
+        end = self._n_recorded + n
+        if end > len(self._trade_log):
+            grown = np.empty(max(end, 2 * len(self._trade_log)), dtype=TRADE_DTYPE)
+            grown[:self._n_recorded] = self._trade_log[:self._n_recorded]
+            self._trade_log = grown
+
+    def _simulate_scans_jit(self, scans_per_day: int):
+        """Run one day's scans through the compiled kernel"""
+        config = self.config
+        max_new_per_scan = 10  # Max 10 new positions per scan
+        kernel = _specialized_day_kernel(len(self.strategy_names), max_new_per_scan)
+
+        if self.record_trades:
+            self._reserve_trade_log(scans_per_day * max_new_per_scan)
+
+        (self.current_capital, self.peak_capital, self.active_position_count,
+         trades, wins, fees, strategy_trades, strategy_wins, strategy_pnl) = kernel(
+            self.rng, scans_per_day, self.combo_strategy_idx, self.combo_symbol_idx,
+            self.combo_timeframe_idx, self.combo_signal_prob,
+            config._score_base, config.soa.win_rate, config.soa.avg_win,
+            config.soa.avg_loss, config.soa.leverage,
+            config.min_position_size_pct, config.max_position_size_pct,
+            config.taker_fee, config.slippage, self._cost_per_unit,
+            config.max_concurrent_positions, self.active_position_count,
+            self.current_capital, self.peak_capital,
+            self.record_trades, self._trade_log, self._n_recorded
+        )
 
-        self.strategy_performance[strategy]['trades'] += 1
-        self.strategy_performance[strategy]['pnl'] += net_pnl
+        if self.record_trades:
+            self._n_recorded += trades
+
+        self.total_trades += trades
+        self.winning_trades += wins
+        self.losing_trades += trades - wins
+        self.total_fees += fees
+        self._perf_trades += strategy_trades
+        self._perf_wins += strategy_wins
+        self._perf_losses += strategy_trades - strategy_wins
+        self._perf_pnl += strategy_pnl
+
+    def _simulate_scans_vectorized(self, scans_per_day: int):
+        """Run one day's scans with NumPy array operations (same draw order as the kernel)"""
+        rng = self.rng
+        max_positions = self.config.max_concurrent_positions
+        combo_strategy_idx = self.combo_strategy_idx
+        combo_symbol_idx = self.combo_symbol_idx
+        execute_trades_batch = self.execute_trades_batch
+
+        # Draw every (scan, combo) signal in one shot; only surviving cells get a confidence
+        u = rng.random((scans_per_day, self.n_combos))
+        signal_mask = u < self.combo_signal_prob[None, :]
+        signal_scans, signal_combos = np.nonzero(signal_mask)
+
+        # np.nonzero is row-major, so each scan's signals are one contiguous run
+        scan_bounds = np.searchsorted(signal_scans, np.arange(scans_per_day + 1))
 
-        # Update peak
-        if self.current_capital > self.peak_capital:
-            self.peak_capital = self.current_capital
+        for scan in range(scans_per_day):
+            slots = max_positions - self.active_position_count
+            lo, hi = scan_bounds[scan], scan_bounds[scan + 1]
+
+            # No free slots: skip signal scoring, just let positions close
+            if slots > 0 and hi > lo:
+                scan_combos = signal_combos[lo:hi]
+                scan_strategy_idx = combo_strategy_idx[scan_combos]
+                confidences = rng.uniform(0.65, 0.95, size=hi - lo)
+                sides = rng.integers(0, 2, size=hi - lo)
+                scores = self.calculate_opportunity_score(scan_strategy_idx, confidences)
+
+                # Execute top opportunities (up to max concurrent positions)
+                positions_to_take = min(
+                    hi - lo,
+                    slots,
+                    10  # Max 10 new positions per scan
+                )
+                if positions_to_take < hi - lo:
+                    top = np.argpartition(scores, -positions_to_take)[-positions_to_take:]
+                else:
+                    top = np.arange(hi - lo)
+
+                # Only the selected handful is ordered, best score first
+                top = top[np.argsort(-scores[top])]
+
+                top_combos = scan_combos[top]
+                execute_trades_batch(
+                    scan_strategy_idx[top],
+                    combo_symbol_idx[top_combos],
+                    confidences[top],
+                    sides[top],
+                    self.combo_timeframe_idx[top_combos] if self.record_trades else None
+                )
+                self.active_position_count += positions_to_take
 
-        return {
-            'strategy': strategy,
-            'symbol': symbol,
-            'side': side,
-            'confidence': confidence,
-            'position_capital': position_capital,
-            'leverage': params['leverage'],
-            'is_win': is_win,
-            'gross_pnl': gross_pnl,
-            'fees': entry_fee + exit_fee,
-            'slippage': slippage_cost,
-            'net_pnl': net_pnl
-        }
+            # Simulate position management (close some positions)
+            # Assume ~20% of positions close each scan
+            self.active_position_count -= int(self.active_position_count * 0.2)
 
     def simulate_day(self, day_num: int) -> Dict:
         """
@@ -285,56 +650,19 @@ class NuclearSwarmBacktest:
         Returns: Daily results
         """
         day_start_capital = self.current_capital
-        daily_trades = []
+        trades_before = self.total_trades
+        wins_before = self.winning_trades
 
         # Simulate 100 scan cycles per day (every ~10 minutes during trading hours)
         scans_per_day = 100
 
-        for scan in range(scans_per_day):
-            # Generate signals across all combinations
-            opportunities = []
-
-            for strategy, params in self.config.strategies.items():
-                for symbol in self.config.symbols:
-                    for timeframe in params['timeframes']:
-                        has_signal, confidence, side = self.simulate_signal_generation(
-                            strategy, symbol, timeframe
-                        )
-
-                        if has_signal:
-                            score = self.calculate_opportunity_score(strategy, confidence)
-                            opportunities.append({
-                                'strategy': strategy,
-                                'symbol': symbol,
-                                'timeframe': timeframe,
-                                'confidence': confidence,
-                                'side': side,
-                                'score': score
-                            })
-
-            # Rank opportunities by score
-            opportunities.sort(key=lambda x: x['score'], reverse=True)
-
-            # Execute top opportunities (up to max concurrent positions)
-            positions_to_take = min(
-                len(opportunities),
-                self.config.max_concurrent_positions - len(self.active_positions),
-                10  # Max 10 new positions per scan
-            )
-
-            for opp in opportunities[:positions_to_take]:
-                trade_result = self.execute_trade(
-                    opp['strategy'],
-                    opp['symbol'],
-                    opp['confidence'],
-                    opp['side']
-                )
-                daily_trades.append(trade_result)
+        if NUMBA_AVAILABLE:
+            self._simulate_scans_jit(scans_per_day)
+        else:
+            self._simulate_scans_vectorized(scans_per_day)
 
-            # Simulate position management (close some positions)
-            # Assume ~20% of positions close each scan
-            close_count = int(len(self.active_positions) * 0.2)
-            self.active_positions = self.active_positions[close_count:]
+        daily_trade_count = self.total_trades - trades_before
+        daily_wins = self.winning_trades - wins_before
 
         # Daily metrics
         day_end_capital = self.current_capital
@@ -350,36 +678,40 @@ class NuclearSwarmBacktest:
             'end_capital': day_end_capital,
             'pnl': daily_pnl,
             'return_pct': daily_return_pct,
-            'trades': len(daily_trades),
-            'wins': sum(1 for t in daily_trades if t['is_win']),
-            'losses': sum(1 for t in daily_trades if not t['is_win'])
+            'trades': daily_trade_count,
+            'wins': daily_wins,
+            'losses': daily_trade_count - daily_wins
         }
 
-    def run(self) -> Dict:
+    def run(self, verbose: bool = True) -> Dict:
         """
         Run complete backtest
 
         Returns: Backtest results
         """
-        logger.info("🚀 Starting nuclear swarm backtest...")
-
         # Calculate duration
         duration_days = (self.config.end_date - self.config.start_date).days
 
-        print("\n" + "=" * 100)
-        print("🔬 NUCLEAR SWARM BACKTEST - 30 DAY SIMULATION")
-        print("=" * 100)
-        print(f"\nPeriod: {self.config.start_date.date()} to {self.config.end_date.date()} ({duration_days} days)")
-        print(f"Initial Capital: ${self.initial_capital:,.2f}")
-        print(f"Combinations per Scan: {self.calculate_total_combinations()}")
-        print(f"Scans per Day: 100")
-        print(f"Max Concurrent Positions: {self.config.max_concurrent_positions}")
-        print("\n" + "=" * 100)
+        if verbose:
+            logger.info("🚀 Starting nuclear swarm backtest...")
+
+            print("\n" + "=" * 100)
+            print("🔬 NUCLEAR SWARM BACKTEST - 30 DAY SIMULATION")
+            print("=" * 100)
+            print(f"\nPeriod: {self.config.start_date.date()} to {self.config.end_date.date()} ({duration_days} days)")
+            print(f"Initial Capital: ${self.initial_capital:,.2f}")
+            print(f"Combinations per Scan: {self.calculate_total_combinations()}")
+            print(f"Scans per Day: 100")
+            print(f"Max Concurrent Positions: {self.config.max_concurrent_positions}")
+            print("\n" + "=" * 100)
 
         # Simulate each day
         for day in range(1, duration_days + 1):
             day_result = self.simulate_day(day)
 
+            if not verbose:
+                continue
+
             # Print progress every 5 days or on key milestones
             if day % 5 == 0 or day in [1, 7, 14, 30]:
                 profit = day_result['end_capital'] - self.initial_capital
@@ -411,15 +743,11 @@ class NuclearSwarmBacktest:
         # Sharpe ratio (assuming risk-free rate of 0)
         sharpe_ratio = (avg_daily_return / daily_volatility) * np.sqrt(365) if daily_volatility > 0 else 0
 
-        # Max drawdown
-        max_dd = 0
-        peak = self.initial_capital
-        for capital in self.daily_capital:
-            if capital > peak:
-                peak = capital
-            dd = ((peak - capital) / peak) * 100
-            if dd > max_dd:
-                max_dd = dd
+        # Max drawdown (running peak starts from initial capital)
+        daily_capital = np.asarray(self.daily_capital)
+        peaks = np.maximum(np.maximum.accumulate(daily_capital), self.initial_capital)
+        drawdowns = (peaks - daily_capital) / peaks
+        max_dd = float(drawdowns.max()) * 100 if len(daily_capital) else 0.0
 
         results = {
             'initial_capital': self.initial_capital,
@@ -437,6 +765,11 @@ class NuclearSwarmBacktest:
             'win_rate': win_rate,
             'total_fees': self.total_fees,
             'strategy_performance': self.strategy_performance,
+            'strategy_names': list(self.strategy_names),
+            'strategy_trades': self._perf_trades.copy(),
+            'strategy_wins': self._perf_wins.copy(),
+            'strategy_losses': self._perf_losses.copy(),
+            'strategy_pnl': self._perf_pnl.copy(),
             'daily_returns': self.daily_returns
         }
 
@@ -476,10 +809,13 @@ class NuclearSwarmBacktest:
         print(f"   {'Strategy':<20} {'Trades':<10} {'Wins':<10} {'Losses':<10} {'Win Rate':<12} {'P&L':<15}")
         print(f"   {'-'*85}")
 
-        for strategy, perf in results['strategy_performance'].items():
-            wr = perf['wins'] / max(1, perf['trades'])
-            print(f"   {strategy:<20} {perf['trades']:<10} {perf['wins']:<10} "
-                  f"{perf['losses']:<10} {wr:<12.1%} ${perf['pnl']:>+12,.2f}")
+        trades = results['strategy_trades']
+        win_rates = np.where(trades > 0, results['strategy_wins'] / np.maximum(trades, 1), 0.0)
+        for strategy, n_trades, wins, losses, wr, pnl in zip(
+                results['strategy_names'], trades, results['strategy_wins'],
+                results['strategy_losses'], win_rates, results['strategy_pnl']):
+            print(f"   {strategy:<20} {n_trades:<10} {wins:<10} "
+                  f"{losses:<10} {wr:<12.1%} ${pnl:>+12,.2f}")
 
         print("\n" + "=" * 100)
         print("🎯 TARGET VALIDATION")
@@ -549,6 +885,66 @@ class NuclearSwarmBacktest:
         print("=" * 100 + "\n")
 
 
+def _quiet_worker():
+    """Silence per-replication setup logging in Monte Carlo workers"""
+    logger.setLevel(logging.WARNING)
+
+
+def _run_one_seed(seed: int, config: BacktestConfig) -> List[float]:
+    """Run one seeded backtest replication and return its daily returns"""
+    return NuclearSwarmBacktest(replace(config, seed=seed)).run(verbose=False)['daily_returns']
+
+
+def run_monte_carlo(config: BacktestConfig, n_replications: int = 200,
+                    base_seed: Optional[int] = None, processes: Optional[int] = None) -> Dict:
+    """
+    Run independent seeded backtest replications across CPU cores
+
+    Returns: Distribution of daily returns across replications
+    """
+    if base_seed is None:
+        base_seed = config.seed
+
+    duration_days = (config.end_date - config.start_date).days
+    daily_returns = np.empty((n_replications, duration_days))
+
+    with Pool(processes=processes, initializer=_quiet_worker) as pool:
+        jobs = [(base_seed + rep_id, config) for rep_id in range(n_replications)]
+        for rep_id, rep_returns in enumerate(pool.starmap(_run_one_seed, jobs)):
+            daily_returns[rep_id] = rep_returns
+
+    avg_daily_returns = daily_returns.mean(axis=1)
+    monthly_projections = ((1 + avg_daily_returns / 100) ** 30 - 1) * 100
+
+    return {
+        'n_replications': n_replications,
+        'daily_returns': daily_returns,
+        'avg_daily_return_mean': float(avg_daily_returns.mean()),
+        'avg_daily_return_std': float(avg_daily_returns.std()),
+        'avg_daily_return_p5': float(np.percentile(avg_daily_returns, 5)),
+        'avg_daily_return_p50': float(np.percentile(avg_daily_returns, 50)),
+        'avg_daily_return_p95': float(np.percentile(avg_daily_returns, 95)),
+        'daily_var_95': float(-np.percentile(daily_returns, 5)),
+        'monthly_projection_p50': float(np.percentile(monthly_projections, 50)),
+        'prob_target_met': float((avg_daily_returns >= 6.39).mean())
+    }
+
+
+def print_monte_carlo_results(mc: Dict):
+    """Print Monte Carlo replication summary"""
+    print("\n" + "=" * 100)
+    print(f"🎲 MONTE CARLO VALIDATION - {mc['n_replications']} REPLICATIONS")
+    print("=" * 100)
+    print(f"\n   Avg Daily Return:    {mc['avg_daily_return_mean']:>+12.2f}% (±{mc['avg_daily_return_std']:.2f}%)")
+    print(f"   5th Percentile:      {mc['avg_daily_return_p5']:>+12.2f}%")
+    print(f"   Median:              {mc['avg_daily_return_p50']:>+12.2f}%")
+    print(f"   95th Percentile:     {mc['avg_daily_return_p95']:>+12.2f}%")
+    print(f"   Daily VaR (95%):     {mc['daily_var_95']:>12.2f}%")
+    print(f"   Median Monthly:      {mc['monthly_projection_p50']:>12.1f}%")
+    print(f"   P(6.39% daily):      {mc['prob_target_met']:>12.1%}")
+    print("=" * 100 + "\n")
+
+
 def main():
     """Run nuclear swarm backtest"""
 
@@ -579,6 +975,9 @@ def main():
     # Print results
     backtest.print_results(results)
 
+    # A single path is one Monte Carlo sample; validate across many seeds
+    print_monte_carlo_results(run_monte_carlo(config, n_replications=200))
+
     # Return results for further analysis
     return results
 
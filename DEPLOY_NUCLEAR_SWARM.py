@@ -13,28 +13,231 @@ READY TO DEPLOY
 """
 
 import asyncio
+import contextlib
+import io
+import math
+import queue
+import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import logging
+import logging.handlers
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+
+    def dumps_status(status: Dict[str, Any]) -> bytes:
+        """Serialize a status dict to JSON bytes"""
+        return orjson.dumps(status, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    import json
+
+    def dumps_status(status: Dict[str, Any]) -> bytes:
+        """Serialize a status dict to JSON bytes"""
+        return json.dumps(status, default=str).encode()
 
 # Import our components
 from nuclear_swarm_orchestrator import NuclearSwarmOrchestrator
 from realtime_dashboard import RealtimeDashboard
 
+
+class CachedTimeFormatter(logging.Formatter):
+    """Log formatter that formats the timestamp once per second, not per record"""
+
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt)
+        self._time_cache = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, cached = self._time_cache
+        if second != cached_second:
+            cached = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._time_cache = (second, cached)
+        if datefmt:
+            return cached
+        return self.default_msec_format % (cached, record.msecs)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that batches writes in a 64KB buffer
+
+    Flushes once ~20KB is pending, a second has passed since the last flush,
+    or an ERROR/CRITICAL record arrives - rather than after every record.
+    """
+
+    flush_bytes = 20_000
+    flush_interval = 1.0
+
+    def __init__(self, filename: str, buffer_size: int = 65536, encoding: str = 'utf-8'):
+        self.buffer_size = buffer_size
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        super().__init__(filename, encoding=encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._pending += len(msg)
+
+            now = time.monotonic()
+            if (record.levelno >= logging.ERROR or self._pending > self.flush_bytes
+                    or now - self._last_flush >= self.flush_interval):
+                self.flush()
+                self._pending = 0
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'nuclear_swarm_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
+LOG_PATH = f'nuclear_swarm_{datetime.now():%Y%m%d_%H%M%S}.log'
+
+
+def _start_logging() -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue to the log file and console
+
+    Callers only enqueue records; a listener thread does the file/console writes.
+    Run by the deployment entry point only, so importing this module leaves the
+    caller's logging alone. Replaces the root logger's handlers (the orchestrator
+    module installs a bare stderr handler on import).
+
+    Returns: the started listener; stop it on exit to flush queued records
+    """
+    handlers = [
+        BufferedFileHandler(LOG_PATH),
         logging.StreamHandler()
     ]
-)
+    formatter = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(logging.INFO)
+
+    listener.start()
+    return listener
+
 
 logger = logging.getLogger(__name__)
 
+# Direct-mapped cache of monthly projections, keyed on the daily return in
+# thousandths of a percent (consecutive cycles rarely move it)
+_PROJECTION_CACHE_SLOTS = 512
+_projection_cache: Dict[int, Tuple[int, float]] = {}
+
+
+def monthly_projection(daily_return_pct: float) -> float:
+    """30-day compounded return (%) for a daily return (%)"""
+    key = round(daily_return_pct * 1000)
+    if key <= -100_000:
+        return -100.0  # Capital wiped out; log1p is undefined from here down
+
+    slot = key % _PROJECTION_CACHE_SLOTS
+    cached = _projection_cache.get(slot)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    projection = math.expm1(30 * math.log1p(key / 100_000)) * 100
+    _projection_cache[slot] = (key, projection)
+    return projection
+
+
+# Static console output, built once at import
+STARTUP_BOX = """
+    ╔════════════════════════════════════════════════════════════════════════════════════════════════╗
+    ║                                                                                                ║
+    ║                        🌊 NUCLEAR SWARM TRADING SYSTEM 🌊                                      ║
+    ║                                                                                                ║
+    ║                           474% Monthly Target Deployment                                       ║
+    ║                                                                                                ║
+    ╚════════════════════════════════════════════════════════════════════════════════════════════════╝
+    """
+
+BANNER_RULE = "=" * 100
+
+DEPLOY_BANNER_TMPL = """
+{rule}
+🚀 NUCLEAR SWARM DEPLOYMENT - LAUNCHING
+{rule}
+
+    Mode:                {mode}
+    Initial Capital:     ${initial_capital:,.2f}
+    Target Monthly:      {target_monthly_pct:.0f}% (${target_monthly_usd:,.2f})
+    Target Daily:        {target_daily_pct:.2f}%
+
+    Swarm Configuration:
+    - Symbols:           {symbols}
+    - Strategies:        {strategies}
+    - Max Positions:     {max_positions}
+    - Total Combinations: {total_combos}
+
+    Risk Management:
+    - Circuit Breakers:  ACTIVE
+    - Position Limits:   {min_position_pct:.1f}% - {max_position_pct:.1f}% per position
+    - Max Utilization:   {max_positions} concurrent positions
+
+    Start Time:          {start_time}
+
+{rule}
+"""
+
+LIVE_WARNING = "\n⚠️  WARNING: LIVE TRADING MODE - REAL MONEY AT RISK ⚠️\n" + BANNER_RULE + "\n\n"
+
+# Pre-flight checks: (name, predicate, pass detail, fail detail), each
+# callable taking the deployment
+PRE_FLIGHT_CHECKS = [
+    ("Capital Available",
+     lambda d: d.swarm.total_capital > 0,
+     lambda d: f"${d.swarm.total_capital:,.2f}",
+     lambda d: "No capital"),
+    ("Strategies Loaded",
+     lambda d: len(d.swarm.strategies) == 5,
+     lambda d: "5/5 strategies",
+     lambda d: f"Only {len(d.swarm.strategies)}/5"),
+    ("Symbols Configured",
+     lambda d: len(d.swarm.active_symbols) >= 10,
+     lambda d: f"{len(d.swarm.active_symbols)} symbols",
+     lambda d: f"Only {len(d.swarm.active_symbols)} symbols"),
+    ("Swarm Capacity",
+     lambda d: d.swarm.max_concurrent_positions >= 50,
+     lambda d: f"{d.swarm.max_concurrent_positions} positions",
+     lambda d: f"Only {d.swarm.max_concurrent_positions} positions"),
+    ("Dashboard Ready",
+     lambda d: d.dashboard is not None,
+     lambda d: "Monitoring active",
+     lambda d: "No dashboard"),
+]
+
 
 class NuclearSwarmDeployment:
     """
@@ -51,7 +254,11 @@ class NuclearSwarmDeployment:
     def __init__(self,
                  initial_capital: float = 500,
                  mode: str = 'PAPER',  # 'PAPER' or 'LIVE'
-                 target_monthly_return: float = 4.74):
+                 target_monthly_return: float = 4.74,
+                 status_trace_path: Optional[str] = None):
+
+        if mode not in ('PAPER', 'LIVE'):
+            raise ValueError(f"mode must be 'PAPER' or 'LIVE', got {mode!r}")
 
         self.mode = mode
         self.initial_capital = initial_capital
@@ -67,6 +274,15 @@ class NuclearSwarmDeployment:
         # Create swarm orchestrator
         self.swarm = NuclearSwarmOrchestrator(total_capital=initial_capital)
 
+        # Fixed for the run: bind what run_cycle uses every cycle once
+        self._swarm_cycle = self.swarm.swarm_cycle
+        self._swarm_status = self.swarm.get_status
+        self._daily_target_pct = self.target_daily_return * 100
+        self._drawdown_scale = -100 / initial_capital
+
+        # The symbol/strategy/timeframe universe is fixed for the run
+        self._total_combos = self.swarm.calculate_total_combinations()
+
         # Create dashboard
         self.dashboard = RealtimeDashboard(
             target_monthly_return=target_monthly_return,
@@ -76,9 +292,66 @@ class NuclearSwarmDeployment:
         # Deployment state
         self.is_running = False
         self.start_time = None
+        self._start_time_str = None
         self.cycles_completed = 0
         self.emergency_stop = False
 
+        # run_cycle is synchronous; run it on a worker thread so the event
+        # loop keeps servicing I/O while the swarm computes
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='swarm-cycle')
+
+        # The dashboard draws on its own thread. run_cycle fills one of two
+        # preallocated status buffers while the renderer may still be drawing
+        # the other; the single-slot queue holds only the newest buffer index.
+        self._peak_capital = initial_capital
+        self._status_buffers = (self._new_status_buffer(), self._new_status_buffer())
+        self._buffer_locks = (threading.Lock(), threading.Lock())
+        self._back_buffer = 0
+        self._render_q: queue.Queue = queue.Queue(maxsize=1)
+        self._render_stop = threading.Event()
+
+        # Optional JSON-lines trace of every cycle's dashboard status
+        self._status_trace = open(status_trace_path, 'ab', buffering=65536) if status_trace_path else None
+
+    def _new_status_buffer(self) -> Dict[str, Any]:
+        """Allocate a dashboard status dict for run_cycle to refresh in place"""
+        return {
+            'timestamp': None,
+            'capital': {
+                'initial': self.initial_capital,
+                'current': self.initial_capital,
+                'peak': self._peak_capital
+            },
+            'trades': {
+                'total': 0,
+                'total_wins': 0,
+                'total_losses': 0,
+                'overall_win_rate': 0.0
+            },
+            'strategies': {
+                'nuclear_swarm': {
+                    'status': 'active',
+                    'trades': 0,
+                    'win_rate': 0.0,
+                    'pnl': 0.0,
+                    'daily_pnl': 0.0,
+                    'allocated_capital': 0.0
+                }
+            },
+            'risk': {
+                'circuit_breaker_active': False,
+                'circuit_breaker_reason': None,
+                'drawdown_pct': 0.0
+            },
+            'target': {
+                'daily_target_pct': self.target_daily_return * 100,
+                'daily_progress_pct': 0.0,
+                'on_track': False,
+                'elapsed_days': 0.0,
+                'monthly_projection': 0.0
+            }
+        }
+
     def pre_flight_checks(self) -> bool:
         """
         Pre-flight safety checks before deployment
@@ -87,159 +360,151 @@ class NuclearSwarmDeployment:
         """
         logger.info("🔍 Running pre-flight checks...")
 
-        checks = []
-
-        # Check 1: Capital available
-        if self.swarm.total_capital > 0:
-            checks.append(("Capital Available", True, f"${self.swarm.total_capital:,.2f}"))
-        else:
-            checks.append(("Capital Available", False, "No capital"))
-
-        # Check 2: Strategies loaded
-        if len(self.swarm.strategies) == 5:
-            checks.append(("Strategies Loaded", True, "5/5 strategies"))
-        else:
-            checks.append(("Strategies Loaded", False, f"Only {len(self.swarm.strategies)}/5"))
-
-        # Check 3: Symbols configured
-        if len(self.swarm.active_symbols) >= 10:
-            checks.append(("Symbols Configured", True, f"{len(self.swarm.active_symbols)} symbols"))
-        else:
-            checks.append(("Symbols Configured", False, f"Only {len(self.swarm.active_symbols)} symbols"))
-
-        # Check 4: Swarm capacity
-        if self.swarm.max_concurrent_positions >= 50:
-            checks.append(("Swarm Capacity", True, f"{self.swarm.max_concurrent_positions} positions"))
-        else:
-            checks.append(("Swarm Capacity", False, f"Only {self.swarm.max_concurrent_positions} positions"))
-
-        # Check 5: Dashboard ready
-        if self.dashboard is not None:
-            checks.append(("Dashboard Ready", True, "Monitoring active"))
-        else:
-            checks.append(("Dashboard Ready", False, "No dashboard"))
-
-        # Print results
-        print("\n" + "=" * 100)
-        print("🔍 PRE-FLIGHT CHECKS")
-        print("=" * 100)
-
+        rows = []
         all_passed = True
-        for check_name, passed, details in checks:
+        for check_name, predicate, pass_detail, fail_detail in PRE_FLIGHT_CHECKS:
+            passed = predicate(self)
+            details = pass_detail(self) if passed else fail_detail(self)
             status = "✅ PASS" if passed else "❌ FAIL"
-            print(f"   {status} | {check_name:<25} | {details}")
-            if not passed:
-                all_passed = False
-
-        print("=" * 100)
+            rows.append(f"   {status} | {check_name:<25} | {details}")
+            all_passed = all_passed and passed
 
         if all_passed:
-            print("✅ ALL CHECKS PASSED - READY FOR DEPLOYMENT")
+            verdict = "✅ ALL CHECKS PASSED - READY FOR DEPLOYMENT"
         else:
-            print("❌ SOME CHECKS FAILED - FIX ISSUES BEFORE DEPLOYMENT")
+            verdict = "❌ SOME CHECKS FAILED - FIX ISSUES BEFORE DEPLOYMENT"
 
-        print("=" * 100 + "\n")
+        # Print results
+        rule = "=" * 100
+        sys.stdout.write("\n".join(["", rule, "🔍 PRE-FLIGHT CHECKS", rule, *rows, rule, verdict, rule, "", ""]))
 
         return all_passed
 
     def display_deployment_banner(self):
         """Display deployment banner"""
-        print("\n" + "=" * 100)
-        print("🚀 NUCLEAR SWARM DEPLOYMENT - LAUNCHING")
-        print("=" * 100)
-        print(f"""
-    Mode:                {self.mode}
-    Initial Capital:     ${self.initial_capital:,.2f}
-    Target Monthly:      {self.target_monthly_return*100:.0f}% (${self.initial_capital * self.target_monthly_return:,.2f})
-    Target Daily:        {self.target_daily_return*100:.2f}%
-
-    Swarm Configuration:
-    - Symbols:           {len(self.swarm.active_symbols)}
-    - Strategies:        {len(self.swarm.strategies)}
-    - Max Positions:     {self.swarm.max_concurrent_positions}
-    - Total Combinations: {self.swarm.calculate_total_combinations()}
-
-    Risk Management:
-    - Circuit Breakers:  ACTIVE
-    - Position Limits:   {self.swarm.min_position_size_pct*100:.1f}% - {self.swarm.max_position_size_pct*100:.1f}% per position
-    - Max Utilization:   {self.swarm.max_concurrent_positions} concurrent positions
-
-    Start Time:          {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """)
-        print("=" * 100)
-
+        banner = DEPLOY_BANNER_TMPL.format_map({
+            'rule': BANNER_RULE,
+            'mode': self.mode,
+            'initial_capital': self.initial_capital,
+            'target_monthly_pct': self.target_monthly_return * 100,
+            'target_monthly_usd': self.initial_capital * self.target_monthly_return,
+            'target_daily_pct': self.target_daily_return * 100,
+            'symbols': len(self.swarm.active_symbols),
+            'strategies': len(self.swarm.strategies),
+            'max_positions': self.swarm.max_concurrent_positions,
+            'total_combos': self._total_combos,
+            'min_position_pct': self.swarm.min_position_size_pct * 100,
+            'max_position_pct': self.swarm.max_position_size_pct * 100,
+            'start_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        })
         if self.mode == 'LIVE':
-            print("\n⚠️  WARNING: LIVE TRADING MODE - REAL MONEY AT RISK ⚠️")
-            print("=" * 100 + "\n")
+            banner += LIVE_WARNING
 
-    def run_cycle(self):
-        """Run one swarm cycle"""
+        sys.stdout.write(banner)
+        sys.stdout.flush()
+
+    def run_cycle(self) -> Optional[Dict[str, Any]]:
+        """Run one swarm cycle, returning the dashboard status (None on error)"""
         try:
             # Execute swarm cycle
-            self.swarm.swarm_cycle()
+            self._swarm_cycle()
             self.cycles_completed += 1
 
             # Update dashboard
-            swarm_status = self.swarm.get_status()
-
-            # Convert to dashboard format
-            orchestrator_status = {
-                'timestamp': datetime.now(),
-                'capital': swarm_status['capital'],
-                'trades': {
-                    'total': swarm_status['swarm']['total_closed'],
-                    'total_wins': int(swarm_status['swarm']['win_rate'] * swarm_status['swarm']['total_closed']),
-                    'total_losses': int((1 - swarm_status['swarm']['win_rate']) * swarm_status['swarm']['total_closed']),
-                    'overall_win_rate': swarm_status['swarm']['win_rate']
-                },
-                'strategies': {
-                    'nuclear_swarm': {
-                        'status': 'active',
-                        'trades': swarm_status['swarm']['active_positions'],
-                        'win_rate': swarm_status['swarm']['win_rate'],
-                        'pnl': swarm_status['capital']['total_pnl'],
-                        'daily_pnl': swarm_status['capital']['daily_pnl'],
-                        'allocated_capital': swarm_status['capital']['deployed']
-                    }
-                },
-                'risk': {
-                    'circuit_breaker_active': self.emergency_stop,
-                    'circuit_breaker_reason': 'Emergency stop activated' if self.emergency_stop else None,
-                    'drawdown_pct': max(0, ((swarm_status['capital']['total'] - self.initial_capital) / self.initial_capital) * -100)
-                },
-                'target': {
-                    'daily_target_pct': self.target_daily_return * 100,
-                    'daily_progress_pct': swarm_status['capital']['daily_return_pct'],
-                    'on_track': swarm_status['capital']['daily_return_pct'] >= self.target_daily_return * 100,
-                    'elapsed_days': (datetime.now() - self.start_time).total_seconds() / 86400 if self.start_time else 0,
-                    'monthly_projection': ((1 + swarm_status['capital']['daily_return_pct']/100) ** 30 - 1) * 100 if swarm_status['capital']['daily_return_pct'] > 0 else 0
-                }
-            }
-
-            # Render dashboard
-            self.dashboard.render(orchestrator_status)
+            swarm_status = self._swarm_status()
+            now = datetime.now()
+
+            capital = swarm_status['capital']
+            swarm = swarm_status['swarm']
+
+            # Refresh the back buffer in place
+            idx = self._back_buffer
+            with self._buffer_locks[idx]:
+                orchestrator_status = self._status_buffers[idx]
+                orchestrator_status['timestamp'] = now
+
+                dash_capital = orchestrator_status['capital']
+                dash_capital.update(capital)
+                dash_capital['current'] = capital['total']
+                self._peak_capital = max(self._peak_capital, capital['total'])
+                dash_capital['peak'] = self._peak_capital
+
+                trades = orchestrator_status['trades']
+                trades['total'] = swarm['total_closed']
+                trades['total_wins'] = swarm['total_wins']
+                trades['total_losses'] = swarm['total_losses']
+                trades['overall_win_rate'] = swarm['win_rate']
+
+                strategy = orchestrator_status['strategies']['nuclear_swarm']
+                strategy['trades'] = swarm['active_positions']
+                strategy['win_rate'] = swarm['win_rate']
+                strategy['pnl'] = capital['total_pnl']
+                strategy['daily_pnl'] = capital['daily_pnl']
+                strategy['allocated_capital'] = capital['deployed']
+
+                risk = orchestrator_status['risk']
+                risk['circuit_breaker_active'] = self.emergency_stop
+                risk['circuit_breaker_reason'] = 'Emergency stop activated' if self.emergency_stop else None
+                risk['drawdown_pct'] = max(0, (capital['total'] - self.initial_capital) * self._drawdown_scale)
+
+                target = orchestrator_status['target']
+                target['daily_progress_pct'] = capital['daily_return_pct']
+                target['on_track'] = capital['daily_return_pct'] >= self._daily_target_pct
+                target['elapsed_days'] = (now - self.start_time).total_seconds() / 86400 if self.start_time else 0
+                target['monthly_projection'] = monthly_projection(capital['daily_return_pct']) if capital['daily_return_pct'] > 0 else 0
+            self._back_buffer = idx ^ 1
 
             # Check for alerts
             self.dashboard.check_alerts(orchestrator_status)
 
             # Log cycle completion
-            logger.info(f"Cycle {self.cycles_completed} complete | "
-                       f"Active: {swarm_status['swarm']['active_positions']} | "
-                       f"Daily: {swarm_status['capital']['daily_return_pct']:+.2f}% | "
-                       f"Total: {swarm_status['capital']['total_return_pct']:+.2f}%")
-
-            # Check for emergency stop conditions
-            if swarm_status['capital']['total_return_pct'] < -15:
+            logger.info("Cycle %d complete | Active: %d | Daily: %+.2f%% | Total: %+.2f%%",
+                        self.cycles_completed, swarm['active_positions'],
+                        capital['daily_return_pct'], capital['total_return_pct'])
+
+            # Check for emergency stop conditions, reporting every tripped one
+            triggers = []
+            if capital['total_return_pct'] < -15:
+                triggers.append("Total loss >15%")
+            if capital['daily_return_pct'] < -10:
+                triggers.append("Daily loss >10%")
+
+            if triggers:
                 self.emergency_stop = True
-                logger.critical("🚨 EMERGENCY STOP: Total loss >15%")
+                logger.critical("🚨 EMERGENCY STOP: %s", "; ".join(triggers))
 
-            if swarm_status['capital']['daily_return_pct'] < -10:
-                self.emergency_stop = True
-                logger.critical("🚨 EMERGENCY STOP: Daily loss >10%")
+            if self._status_trace is not None:
+                self._status_trace.write(dumps_status(orchestrator_status) + b"\n")
+
+            self._publish_status(idx)
+            return orchestrator_status
 
         except Exception as e:
-            logger.error(f"Error in swarm cycle: {e}", exc_info=True)
+            logger.error("Error in swarm cycle: %s", e, exc_info=True)
             self.emergency_stop = True
+            return None
+
+    def _publish_status(self, idx: int):
+        """Hand a status buffer to the render thread, dropping a stale one"""
+        try:
+            self._render_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._render_q.put_nowait(idx)
+
+    def _render_worker(self):
+        """Draw the newest published status buffer until told to stop"""
+        while True:
+            idx = self._render_q.get()
+            if idx is None:
+                break
+            try:
+                with self._buffer_locks[idx]:
+                    self.dashboard.render(self._status_buffers[idx])
+            except Exception as e:
+                logger.error("Error rendering dashboard: %s", e, exc_info=True)
+            if self._render_stop.wait(self.dashboard.refresh_interval):
+                break
 
     async def deploy(self, duration_hours: float = 24):
         """
@@ -249,99 +514,156 @@ class NuclearSwarmDeployment:
             duration_hours: How long to run (default 24 hours)
         """
         self.start_time = datetime.now()
+        self._start_time_str = self.start_time.strftime('%Y-%m-%d %H:%M:%S')
         self.is_running = True
 
-        logger.info(f"🚀 DEPLOYMENT STARTED - Running for {duration_hours} hours")
+        logger.info("🚀 DEPLOYMENT STARTED - Running for %s hours", duration_hours)
 
-        end_time = self.start_time + timedelta(hours=duration_hours)
+        # Schedule against monotonic deadlines so the cycle's own run time
+        # doesn't stretch the interval
+        loop = asyncio.get_running_loop()
         cycle_interval = 10  # 10 seconds between cycles
+        started = loop.time()
+        deadline = started + duration_hours * 3600.0
+        next_cycle = started
 
-        while self.is_running and datetime.now() < end_time:
-            if self.emergency_stop:
-                logger.critical("🚨 EMERGENCY STOP ACTIVATED - HALTING ALL TRADING")
-                break
+        # SIGINT/SIGTERM stop the run cooperatively: the current cycle
+        # finishes and the inter-cycle wait ends early
+        stop_event = asyncio.Event()
+        restore_signals = self._install_stop_handlers(loop, stop_event)
+
+        try:
+            render_thread = threading.Thread(target=self._render_worker, name='dashboard-render', daemon=True)
+            render_thread.start()
+            try:
+                while self.is_running and loop.time() < deadline:
+                    if self.emergency_stop:
+                        logger.critical("🚨 EMERGENCY STOP ACTIVATED - HALTING ALL TRADING")
+                        break
+
+                    # Run swarm cycle
+                    await loop.run_in_executor(self._executor, self.run_cycle)
+
+                    # Wait for next cycle (or a stop request)
+                    next_cycle += cycle_interval
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(stop_event.wait(), timeout=max(0.0, next_cycle - loop.time()))
+            finally:
+                # Wake the render thread; if a status is still queued it
+                # draws that one and then sees the stop flag
+                self._render_stop.set()
+                with contextlib.suppress(queue.Full):
+                    self._render_q.put_nowait(None)
+                render_thread.join()
+
+            # Deployment ended
+            self.is_running = False
+            duration_actual = (loop.time() - started) / 3600
+
+            logger.info("🛑 DEPLOYMENT ENDED - Ran for %.2f hours", duration_actual)
+
+            # Print final summary
+            self.print_final_summary()
+        finally:
+            # Kept until here so a second Ctrl+C during shutdown is harmless
+            restore_signals()
+
+    def _request_stop(self, stop_event: asyncio.Event):
+        """Stop after the current cycle (called on SIGINT/SIGTERM)"""
+        logger.info("Stop requested - finishing current cycle")
+        self.is_running = False
+        stop_event.set()
 
-            # Run swarm cycle
-            self.run_cycle()
+    def _install_stop_handlers(self, loop: asyncio.AbstractEventLoop, stop_event: asyncio.Event):
+        """Route SIGINT/SIGTERM to _request_stop; returns a callable that undoes it"""
+        signals = [signal.SIGINT, signal.SIGTERM]
 
-            # Wait for next cycle
-            await asyncio.sleep(cycle_interval)
+        try:
+            for sig in signals:
+                loop.add_signal_handler(sig, self._request_stop, stop_event)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler
+            def handler(signum, frame):
+                loop.call_soon_threadsafe(self._request_stop, stop_event)
 
-        # Deployment ended
-        self.is_running = False
-        end_time_actual = datetime.now()
-        duration_actual = (end_time_actual - self.start_time).total_seconds() / 3600
+            previous = {sig: signal.signal(sig, handler) for sig in signals}
 
-        logger.info(f"🛑 DEPLOYMENT ENDED - Ran for {duration_actual:.2f} hours")
+            def restore():
+                for sig, prev in previous.items():
+                    signal.signal(sig, prev)
+            return restore
 
-        # Print final summary
-        self.print_final_summary()
+        def remove():
+            for sig in signals:
+                loop.remove_signal_handler(sig)
+        return remove
 
     def print_final_summary(self):
         """Print final deployment summary"""
+        # Let any in-flight cycle finish before reading the final state
+        self._executor.shutdown(wait=True)
+        if self._status_trace is not None:
+            self._status_trace.close()
         status = self.swarm.get_status()
 
-        print("\n" + "=" * 100)
-        print("📊 NUCLEAR SWARM DEPLOYMENT - FINAL SUMMARY")
-        print("=" * 100)
-
-        print(f"\n⏱️  DEPLOYMENT DURATION:")
-        duration = (datetime.now() - self.start_time).total_seconds() / 3600
-        print(f"   Started:  {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"   Ended:    {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"   Duration: {duration:.2f} hours ({self.cycles_completed} cycles)")
-
-        print(f"\n💰 FINANCIAL RESULTS:")
-        print(f"   Initial Capital:    ${self.initial_capital:,.2f}")
-        print(f"   Final Capital:      ${status['capital']['total']:,.2f}")
-        print(f"   Total P&L:          ${status['capital']['total_pnl']:+,.2f}")
-        print(f"   Total Return:       {status['capital']['total_return_pct']:+.2f}%")
-        print(f"   Daily Return:       {status['capital']['daily_return_pct']:+.2f}%")
-
-        print(f"\n🐝 SWARM PERFORMANCE:")
-        print(f"   Total Positions Opened:  {status['swarm']['total_opened']}")
-        print(f"   Total Positions Closed:  {status['swarm']['total_closed']}")
-        print(f"   Win Rate:                {status['swarm']['win_rate']*100:.1f}%")
-        print(f"   Peak Utilization:        {status['swarm']['active_positions']} / {status['swarm']['max_capacity']}")
-
-        print(f"\n🔍 OPPORTUNITY STATS:")
-        print(f"   Opportunities Scanned:   {status['opportunities']['scanned']}")
-        print(f"   Opportunities Taken:     {status['opportunities']['taken']}")
-        print(f"   Acceptance Rate:         {status['opportunities']['acceptance_rate']:.1f}%")
-
-        print(f"\n🎯 TARGET PROGRESS:")
-        print(f"   Monthly Target:          {self.target_monthly_return*100:.0f}%")
-        monthly_projection = ((1 + status['capital']['daily_return_pct']/100) ** 30 - 1) * 100
-        print(f"   Monthly Projection:      {monthly_projection:.1f}%")
-
-        if monthly_projection >= self.target_monthly_return * 100:
-            print(f"   Status:                  ✅ ON TRACK FOR TARGET")
+        buf = io.StringIO()
+        print("\n" + "=" * 100, file=buf)
+        print("📊 NUCLEAR SWARM DEPLOYMENT - FINAL SUMMARY", file=buf)
+        print("=" * 100, file=buf)
+
+        print(f"\n⏱️  DEPLOYMENT DURATION:", file=buf)
+        now = datetime.now()
+        duration = (now - self.start_time).total_seconds() / 3600
+        print(f"   Started:  {self._start_time_str}", file=buf)
+        print(f"   Ended:    {now.strftime('%Y-%m-%d %H:%M:%S')}", file=buf)
+        print(f"   Duration: {duration:.2f} hours ({self.cycles_completed} cycles)", file=buf)
+
+        print(f"\n💰 FINANCIAL RESULTS:", file=buf)
+        print(f"   Initial Capital:    ${self.initial_capital:,.2f}", file=buf)
+        print(f"   Final Capital:      ${status['capital']['total']:,.2f}", file=buf)
+        print(f"   Total P&L:          ${status['capital']['total_pnl']:+,.2f}", file=buf)
+        print(f"   Total Return:       {status['capital']['total_return_pct']:+.2f}%", file=buf)
+        print(f"   Daily Return:       {status['capital']['daily_return_pct']:+.2f}%", file=buf)
+
+        print(f"\n🐝 SWARM PERFORMANCE:", file=buf)
+        print(f"   Total Positions Opened:  {status['swarm']['total_opened']}", file=buf)
+        print(f"   Total Positions Closed:  {status['swarm']['total_closed']}", file=buf)
+        print(f"   Win Rate:                {status['swarm']['win_rate']*100:.1f}%", file=buf)
+        print(f"   Peak Utilization:        {status['swarm']['active_positions']} / {status['swarm']['max_capacity']}", file=buf)
+
+        print(f"\n🔍 OPPORTUNITY STATS:", file=buf)
+        print(f"   Opportunities Scanned:   {status['opportunities']['scanned']}", file=buf)
+        print(f"   Opportunities Taken:     {status['opportunities']['taken']}", file=buf)
+        print(f"   Acceptance Rate:         {status['opportunities']['acceptance_rate']:.1f}%", file=buf)
+
+        print(f"\n🎯 TARGET PROGRESS:", file=buf)
+        print(f"   Monthly Target:          {self.target_monthly_return*100:.0f}%", file=buf)
+        projection = monthly_projection(status['capital']['daily_return_pct'])
+        print(f"   Monthly Projection:      {projection:.1f}%", file=buf)
+
+        if projection >= self.target_monthly_return * 100:
+            print(f"   Status:                  ✅ ON TRACK FOR TARGET", file=buf)
         else:
-            shortfall = self.target_monthly_return * 100 - monthly_projection
-            print(f"   Status:                  ⚠️ Shortfall: {shortfall:.1f}%")
+            shortfall = self.target_monthly_return * 100 - projection
+            print(f"   Status:                  ⚠️ Shortfall: {shortfall:.1f}%", file=buf)
 
-        print("\n" + "=" * 100)
+        print("\n" + "=" * 100, file=buf)
 
         if status['capital']['total_pnl'] > 0:
-            print("✅ DEPLOYMENT PROFITABLE - MISSION SUCCESS")
+            print("✅ DEPLOYMENT PROFITABLE - MISSION SUCCESS", file=buf)
         else:
-            print("❌ DEPLOYMENT UNPROFITABLE - REVIEW AND ADJUST")
+            print("❌ DEPLOYMENT UNPROFITABLE - REVIEW AND ADJUST", file=buf)
+
+        print("=" * 100 + "\n", file=buf)
 
-        print("=" * 100 + "\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 async def main():
     """Main deployment entry point"""
 
-    print("""
-    ╔════════════════════════════════════════════════════════════════════════════════════════════════╗
-    ║                                                                                                ║
-    ║                        🌊 NUCLEAR SWARM TRADING SYSTEM 🌊                                      ║
-    ║                                                                                                ║
-    ║                           474% Monthly Target Deployment                                       ║
-    ║                                                                                                ║
-    ╚════════════════════════════════════════════════════════════════════════════════════════════════╝
-    """)
+    print(STARTUP_BOX)
 
     # Configuration
     INITIAL_CAPITAL = 500
@@ -383,16 +705,21 @@ async def main():
 
     try:
         await deployment.deploy(duration_hours=DURATION_HOURS)
-    except KeyboardInterrupt:
-        logger.info("Deployment interrupted by user (Ctrl+C)")
-        deployment.is_running = False
-        deployment.print_final_summary()
     except Exception as e:
-        logger.error(f"Deployment error: {e}", exc_info=True)
+        logger.error("Deployment error: %s", e, exc_info=True)
         deployment.emergency_stop = True
         deployment.print_final_summary()
 
 
 if __name__ == '__main__':
-    # Run deployment
-    asyncio.run(main())
+    log_listener = _start_logging()
+    try:
+        # Run deployment (on uvloop when installed)
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            if sys.platform == 'win32':
+                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+            asyncio.run(main())
+    finally:
+        log_listener.stop()
@@ -18,14 +18,122 @@ Goal: PROVE system is STABLE, CONSISTENT, and RELIABLE
 Not just profitable - but DEPENDABLE
 """
 
+import contextlib
+import io
+import os
+import sys
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-import logging
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Report rules and pass thresholds, built once
+SEP100 = "=" * 100
+BANNER_TOP = "╔" + "=" * 98 + "╗"
+BANNER_BOT = "╚" + "=" * 98 + "╝"
+TARGET_70 = 474 * 0.7  # 70% of the 474% monthly target
+TARGET_60 = 474 * 0.6  # 60% of target, acceptable in harsh conditions
+
+AUDIT_BANNER = "\n".join((
+    "\n" + BANNER_TOP,
+    "║" + " 🔬 FORENSIC STABILITY & CONSISTENCY AUDIT 🔬".center(98) + "║",
+    "║" + " Nuclear Swarm System Validation".center(98) + "║",
+    BANNER_BOT,
+))
+
+# Final verdict by minimum share of tests passed, checked in order
+SUMMARY_VERDICTS = (
+    (1.0, """✅ FORENSIC AUDIT COMPLETE: SYSTEM FULLY VALIDATED
+   • STABLE across all time periods
+   • CONSISTENT across market conditions
+   • RESILIENT to stress scenarios
+   • CONTROLLED risk management
+   • SUSTAINABLE long-term performance
+
+🚀 SYSTEM IS READY FOR DEPLOYMENT"""),
+    (0.80, """⚠️ FORENSIC AUDIT COMPLETE: SYSTEM MOSTLY VALIDATED
+   • Most tests passed
+   • Some areas need attention
+   • Review failed tests before deployment
+
+⏳ PROCEED WITH CAUTION"""),
+    (0.0, """❌ FORENSIC AUDIT COMPLETE: SYSTEM NEEDS IMPROVEMENT
+   • Multiple critical failures
+   • System not ready for deployment
+   • Requires parameter tuning and testing
+
+🛑 DO NOT DEPLOY YET"""),
+)
+
+
+# Explicit signature compiles at import (then loads from the on-disk cache),
+# so the audit never pays JIT latency inside test 5
+@njit('UniTuple(f8, 5)(f8[::1])', cache=True)
+def _scan_drawdowns(equity):
+    """
+    Peak-tracking drawdown scan over an equity curve
+
+    Every point at or below the running peak counts as a drawdown sample;
+    a drawdown >2% opens an event that closes on the next new peak.
+
+    Returns: (max drawdown %, avg drawdown %, samples >5%,
+              recoveries, avg recovery time in days)
+    """
+    peak = equity[0]
+    dd_sum = 0.0
+    dd_count = 0
+    max_dd = 0.0
+    n_severe = 0
+    recovery_sum = 0.0
+    n_recoveries = 0
+    in_drawdown = False
+    dd_start = 0
+
+    for i in range(equity.shape[0]):
+        value = equity[i]
+        if value > peak:
+            # New peak
+            if in_drawdown:
+                # Recovered
+                recovery_sum += i - dd_start
+                n_recoveries += 1
+                in_drawdown = False
+            peak = value
+        else:
+            # Drawdown
+            dd_pct = ((peak - value) / peak) * 100
+            dd_sum += dd_pct
+            dd_count += 1
+            if dd_pct > max_dd:
+                max_dd = dd_pct
+            if dd_pct > 5:
+                n_severe += 1
+
+            if not in_drawdown and dd_pct > 2:  # Significant drawdown
+                in_drawdown = True
+                dd_start = i
+
+    avg_dd = dd_sum / dd_count if dd_count > 0 else 0.0
+    avg_recovery = recovery_sum / n_recoveries if n_recoveries > 0 else 0.0
+    return max_dd, avg_dd, float(n_severe), float(n_recoveries), avg_recovery
+
+
+@dataclass(slots=True)
+class TestResult:
+    """Outcome of one audit test"""
+    name: str
+    passed: bool
+    metrics: Dict
 
 
 class ForensicStabilityAudit:
@@ -40,30 +148,40 @@ class ForensicStabilityAudit:
     - Stress conditions
     """
 
-    def __init__(self, initial_capital: float = 500):
+    # Audit tests in run order; independent of each other
+    TEST_METHODS = (
+        'test_1_multi_period_consistency',
+        'test_2_market_regime_testing',
+        'test_3_stress_testing',
+        'test_4_win_rate_stability',
+        'test_5_drawdown_behavior',
+        'test_6_long_term_sustainability',
+    )
+
+    def __init__(self, initial_capital: float = 500, seed: Optional[int] = None):
         self.initial_capital = initial_capital
-        self.audit_results = {}
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.audit_results: List[TestResult] = []
 
-    def print_header(self, test_name: str):
-        """Print test header"""
-        print("\n" + "=" * 100)
-        print(f"🔬 {test_name}")
-        print("=" * 100)
+    def format_header(self, test_name: str) -> List[str]:
+        """Format test header, starting a test's report lines"""
+        return [f"\n{SEP100}\n🔬 {test_name}\n{SEP100}"]
 
-    def print_result(self, test_name: str, passed: bool, details: str = ""):
-        """Print test result"""
+    def format_result(self, test_name: str, passed: bool, details: str = "") -> str:
+        """Format test result line"""
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status} | {test_name:<50} | {details}")
+        return f"{status} | {test_name:<50} | {details}"
 
-    def test_1_multi_period_consistency(self) -> Dict:
+    def test_1_multi_period_consistency(self) -> TestResult:
         """
         TEST 1: Multi-Period Consistency
         Run backtest on 6 different months to ensure consistent performance
         """
-        self.print_header("TEST 1: MULTI-PERIOD CONSISTENCY")
+        lines = self.format_header("TEST 1: MULTI-PERIOD CONSISTENCY")
 
-        print("\nTesting performance across 6 different time periods...")
-        print("Goal: Verify consistent returns regardless of market conditions\n")
+        lines.append("\nTesting performance across 6 different time periods...")
+        lines.append("Goal: Verify consistent returns regardless of market conditions\n")
 
         # Simulate 6 different monthly periods
         periods = [
@@ -75,85 +193,90 @@ class ForensicStabilityAudit:
             ("Jun 2024", datetime(2024, 6, 1), datetime(2024, 6, 30)),
         ]
 
-        results = []
+        # Simulate monthly returns with realistic variation, one draw per metric
+        uniform = self.rng.uniform
+        n_periods = len(periods)
 
-        for period_name, start_date, end_date in periods:
-            # Simulate monthly return with realistic variation
-            base_daily_return = 7.70  # From backtest
-            variation = np.random.uniform(-0.15, 0.15)  # ±15% variation
-            actual_daily_return = base_daily_return * (1 + variation)
+        base_daily_return = 7.70  # From backtest
+        variations = uniform(-0.15, 0.15, n_periods)  # ±15% variation
+        daily_returns = base_daily_return * (1 + variations)
 
-            # Calculate monthly
-            monthly_return = ((1 + actual_daily_return/100) ** 30 - 1) * 100
+        # Calculate monthly
+        monthly_returns = ((1 + daily_returns/100) ** 30 - 1) * 100
 
-            # Simulate metrics
-            win_rate = 0.714 + np.random.uniform(-0.05, 0.05)
-            max_dd = abs(np.random.uniform(0, 8))
-            sharpe = 86.94 + np.random.uniform(-15, 15)
+        # Simulate metrics
+        win_rates = 0.714 + uniform(-0.05, 0.05, n_periods)
+        max_dds = np.abs(uniform(0, 8, n_periods))
+        sharpes = 86.94 + uniform(-15, 15, n_periods)
+
+        results = []
 
+        for i, (period_name, start_date, end_date) in enumerate(periods):
             results.append({
                 'period': period_name,
-                'daily_return': actual_daily_return,
-                'monthly_return': monthly_return,
-                'win_rate': win_rate,
-                'max_dd': max_dd,
-                'sharpe': sharpe
+                'daily_return': float(daily_returns[i]),
+                'monthly_return': float(monthly_returns[i]),
+                'win_rate': float(win_rates[i]),
+                'max_dd': float(max_dds[i]),
+                'sharpe': float(sharpes[i])
             })
 
-            print(f"   {period_name}: {monthly_return:>7.1f}% monthly | "
-                  f"Daily: {actual_daily_return:>5.2f}% | "
-                  f"WR: {win_rate*100:>5.1f}% | "
-                  f"DD: {max_dd:>5.1f}% | "
-                  f"Sharpe: {sharpe:>5.1f}")
+            lines.append(f"   {period_name}: {monthly_returns[i]:>7.1f}% monthly | "
+                         f"Daily: {daily_returns[i]:>5.2f}% | "
+                         f"WR: {win_rates[i]*100:>5.1f}% | "
+                         f"DD: {max_dds[i]:>5.1f}% | "
+                         f"Sharpe: {sharpes[i]:>5.1f}")
 
         # Calculate consistency metrics
-        monthly_returns = [r['monthly_return'] for r in results]
-        avg_return = np.mean(monthly_returns)
-        std_return = np.std(monthly_returns)
-        min_return = min(monthly_returns)
-        max_return = max(monthly_returns)
-
-        print(f"\n📊 CONSISTENCY METRICS:")
-        print(f"   Average Monthly:     {avg_return:>7.1f}%")
-        print(f"   Std Deviation:       {std_return:>7.1f}%")
-        print(f"   Range:               {min_return:>7.1f}% to {max_return:>7.1f}%")
-        print(f"   Coefficient of Var:  {(std_return/avg_return)*100:>7.1f}%")
+        avg_return = monthly_returns.mean()
+        std_return = monthly_returns.std()
+        min_return = monthly_returns.min()
+        max_return = monthly_returns.max()
+        cv = std_return / avg_return
+
+        lines.append(f"\n📊 CONSISTENCY METRICS:")
+        lines.append(f"   Average Monthly:     {avg_return:>7.1f}%")
+        lines.append(f"   Std Deviation:       {std_return:>7.1f}%")
+        lines.append(f"   Range:               {min_return:>7.1f}% to {max_return:>7.1f}%")
+        lines.append(f"   Coefficient of Var:  {cv*100:>7.1f}%")
 
         # Pass criteria
-        all_positive = all(r['monthly_return'] > 0 for r in results)
-        all_above_target = all(r['monthly_return'] >= 474 * 0.7 for r in results)  # 70% of target
-        stable_variance = (std_return / avg_return) < 0.30  # CV < 30%
+        all_positive = bool((monthly_returns > 0).all())
+        all_above_target = bool((monthly_returns >= TARGET_70).all())  # 70% of target
+        stable_variance = bool(cv < 0.30)  # CV < 30%
 
         passed = all_positive and all_above_target and stable_variance
 
-        print(f"\n📋 TEST RESULTS:")
-        self.print_result("All periods profitable", all_positive)
-        self.print_result("All periods ≥70% of target (331%)", all_above_target)
-        self.print_result("Variance stable (CV <30%)", stable_variance, f"CV: {(std_return/avg_return)*100:.1f}%")
+        lines.append(f"\n📋 TEST RESULTS:")
+        lines.append(self.format_result("All periods profitable", all_positive))
+        lines.append(self.format_result("All periods ≥70% of target (331%)", all_above_target))
+        lines.append(self.format_result("Variance stable (CV <30%)", stable_variance, f"CV: {cv*100:.1f}%"))
 
         if passed:
-            print(f"\n✅ TEST 1 PASSED: System shows CONSISTENT performance across periods")
+            lines.append(f"\n✅ TEST 1 PASSED: System shows CONSISTENT performance across periods")
         else:
-            print(f"\n❌ TEST 1 FAILED: Performance too inconsistent across periods")
+            lines.append(f"\n❌ TEST 1 FAILED: Performance too inconsistent across periods")
 
-        self.audit_results['multi_period'] = {
-            'passed': passed,
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        result = TestResult('multi_period', passed, {
             'results': results,
             'avg_return': avg_return,
             'consistency': stable_variance
-        }
+        })
+        self.audit_results.append(result)
 
-        return self.audit_results['multi_period']
+        return result
 
-    def test_2_market_regime_testing(self) -> Dict:
+    def test_2_market_regime_testing(self) -> TestResult:
         """
         TEST 2: Market Regime Testing
         Test performance in different market conditions
         """
-        self.print_header("TEST 2: MARKET REGIME TESTING")
+        lines = self.format_header("TEST 2: MARKET REGIME TESTING")
 
-        print("\nTesting performance across different market regimes...")
-        print("Goal: Verify system works in bull, bear, sideways, and volatile markets\n")
+        lines.append("\nTesting performance across different market regimes...")
+        lines.append("Goal: Verify system works in bull, bear, sideways, and volatile markets\n")
 
         regimes = {
             'Bull Market (Strong Uptrend)': {
@@ -178,18 +301,27 @@ class ForensicStabilityAudit:
             }
         }
 
-        results = []
+        # Drawdown noise for every regime in one draw
+        uniform = self.rng.uniform
+        drawdown_draws = np.abs(uniform(0, 5, len(regimes)))
+
+        # Apply modifiers to base performance for all regimes at once
+        base_daily = 7.70
+        daily_returns = base_daily * np.array([m['daily_return_modifier'] for m in regimes.values()])
+        monthly_returns = (np.power(1 + daily_returns/100, 30) - 1) * 100
+
+        base_wr = 0.714
+        win_rates = np.minimum(0.95, base_wr * np.array([m['win_rate_modifier'] for m in regimes.values()]))
 
-        for regime_name, modifiers in regimes.items():
-            # Apply modifiers to base performance
-            base_daily = 7.70
-            daily_return = base_daily * modifiers['daily_return_modifier']
-            monthly_return = ((1 + daily_return/100) ** 30 - 1) * 100
+        max_dds = drawdown_draws * np.array([m['drawdown_risk'] for m in regimes.values()])
 
-            base_wr = 0.714
-            win_rate = min(0.95, base_wr * modifiers['win_rate_modifier'])
+        results = []
 
-            max_dd = abs(np.random.uniform(0, 5)) * modifiers['drawdown_risk']
+        for i, regime_name in enumerate(regimes):
+            daily_return = float(daily_returns[i])
+            monthly_return = float(monthly_returns[i])
+            win_rate = float(win_rates[i])
+            max_dd = float(max_dds[i])
 
             results.append({
                 'regime': regime_name,
@@ -199,373 +331,348 @@ class ForensicStabilityAudit:
                 'max_dd': max_dd
             })
 
-            meets_target = monthly_return >= 474 * 0.6  # 60% of target acceptable in harsh conditions
+            meets_target = monthly_return >= TARGET_60  # 60% of target acceptable in harsh conditions
 
-            print(f"   {regime_name:<35} | Monthly: {monthly_return:>7.1f}% | "
-                  f"WR: {win_rate*100:>5.1f}% | DD: {max_dd:>5.1f}% | "
-                  f"{'✅' if meets_target else '⚠️'}")
+            lines.append(f"   {regime_name:<35} | Monthly: {monthly_return:>7.1f}% | "
+                         f"WR: {win_rate*100:>5.1f}% | DD: {max_dd:>5.1f}% | "
+                         f"{'✅' if meets_target else '⚠️'}")
 
         # Pass criteria
-        all_profitable = all(r['monthly_return'] > 0 for r in results)
-        most_meet_target = sum(1 for r in results if r['monthly_return'] >= 474 * 0.6) >= 3
-        acceptable_drawdowns = all(r['max_dd'] < 20 for r in results)
+        all_profitable = bool((monthly_returns > 0).all())
+        most_meet_target = int((monthly_returns >= TARGET_60).sum()) >= 3
+        acceptable_drawdowns = bool((max_dds < 20).all())
 
         passed = all_profitable and most_meet_target and acceptable_drawdowns
 
-        print(f"\n📋 TEST RESULTS:")
-        self.print_result("All regimes profitable", all_profitable)
-        self.print_result("Most regimes meet 60% target", most_meet_target)
-        self.print_result("All drawdowns <20%", acceptable_drawdowns)
+        lines.append(f"\n📋 TEST RESULTS:")
+        lines.append(self.format_result("All regimes profitable", all_profitable))
+        lines.append(self.format_result("Most regimes meet 60% target", most_meet_target))
+        lines.append(self.format_result("All drawdowns <20%", acceptable_drawdowns))
 
         if passed:
-            print(f"\n✅ TEST 2 PASSED: System adapts to DIFFERENT market conditions")
+            lines.append(f"\n✅ TEST 2 PASSED: System adapts to DIFFERENT market conditions")
         else:
-            print(f"\n❌ TEST 2 FAILED: System struggles in certain market conditions")
+            lines.append(f"\n❌ TEST 2 FAILED: System struggles in certain market conditions")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        self.audit_results['market_regimes'] = {
-            'passed': passed,
+        result = TestResult('market_regimes', passed, {
             'results': results
-        }
+        })
+        self.audit_results.append(result)
 
-        return self.audit_results['market_regimes']
+        return result
 
-    def test_3_stress_testing(self) -> Dict:
+    def test_3_stress_testing(self) -> TestResult:
         """
         TEST 3: Stress Testing
         Test system under extreme scenarios
         """
-        self.print_header("TEST 3: STRESS TESTING")
-
-        print("\nTesting system behavior under extreme stress scenarios...")
-        print("Goal: Verify circuit breakers and risk management work properly\n")
-
-        stress_scenarios = {
-            'Flash Crash (-20% in 1 hour)': {
-                'simulated_daily_loss': -18.5,
-                'circuit_breaker_should_trigger': True,
-                'expected_max_loss': -15.0  # Should stop at 15%
-            },
-            'Extreme Volatility (±10% swings)': {
-                'simulated_daily_return': 3.2,  # Reduced from normal
-                'win_rate_drop': 0.55,
-                'should_continue': True
-            },
-            'Exchange Downtime (4 hours)': {
-                'missed_opportunities': 0.40,  # Miss 40% of trades
-                'simulated_daily_return': 4.6,
-                'should_recover': True
-            },
-            'Liquidity Drought (High slippage)': {
-                'slippage_multiplier': 5.0,
-                'simulated_daily_return': 5.8,
-                'still_profitable': True
-            },
-            'API Rate Limits Hit': {
-                'execution_delay': True,
-                'simulated_daily_return': 6.2,
-                'degraded_but_functional': True
-            }
-        }
+        lines = self.format_header("TEST 3: STRESS TESTING")
+
+        lines.append("\nTesting system behavior under extreme stress scenarios...")
+        lines.append("Goal: Verify circuit breakers and risk management work properly\n")
+
+        # kind 0: loss the circuit breaker must contain (param = simulated daily loss)
+        # kind 1: degraded conditions (param = simulated daily return)
+        scenarios = np.array([
+            ('Flash Crash (-20% in 1 hour)', 0, -18.5),
+            ('Extreme Volatility (±10% swings)', 1, 3.2),  # Reduced from normal
+            ('Exchange Downtime (4 hours)', 1, 4.6),  # Miss 40% of trades
+            ('Liquidity Drought (High slippage)', 1, 5.8),  # 5x slippage
+            ('API Rate Limits Hit', 1, 6.2),  # Execution delay
+        ], dtype=[('name', 'U40'), ('kind', 'u1'), ('param', 'f8')])
+        expected_max_loss = -15.0  # Circuit breaker should stop at 15%
+
+        params = scenarios['param']
+        is_crash = scenarios['kind'] == 0
+
+        # Circuit breaker clamps the crash loss; resilience cases just need a positive return
+        actual_losses = np.maximum(params, expected_max_loss)
+        contained = actual_losses <= expected_max_loss
+        still_works = params > 0
+        scenario_passed = np.where(is_crash, contained, still_works)
 
         results = []
 
-        for scenario, params in stress_scenarios.items():
-            if 'Flash Crash' in scenario:
-                # Test circuit breaker
-                simulated_loss = params['simulated_daily_loss']
-                expected_max = params['expected_max_loss']
-                actual_max_loss = max(simulated_loss, expected_max)  # Circuit breaker stops it
-
-                triggered = actual_max_loss > expected_max
-                contained = actual_max_loss <= expected_max
+        for i, scenario in enumerate(scenarios['name'].tolist()):
+            if is_crash[i]:
+                loss_contained = bool(contained[i])
 
                 results.append({
                     'scenario': scenario,
-                    'simulated_loss': simulated_loss,
-                    'actual_loss': actual_max_loss,
-                    'circuit_breaker_triggered': not triggered,
-                    'loss_contained': contained,
-                    'passed': contained
+                    'simulated_loss': float(params[i]),
+                    'actual_loss': float(actual_losses[i]),
+                    'circuit_breaker_triggered': loss_contained,
+                    'loss_contained': loss_contained,
+                    'passed': loss_contained
                 })
 
-                print(f"   {scenario:<40} | Loss: {actual_max_loss:>6.1f}% | "
-                      f"CB: {'✅ Triggered' if not triggered else '❌ Failed'} | "
-                      f"{'✅ Contained' if contained else '❌ Exceeded'}")
+                lines.append(f"   {scenario:<40} | Loss: {actual_losses[i]:>6.1f}% | "
+                             f"CB: {'✅ Triggered' if loss_contained else '❌ Failed'} | "
+                             f"{'✅ Contained' if loss_contained else '❌ Exceeded'}")
 
             else:
-                # Test resilience
-                daily_return = params.get('simulated_daily_return', 7.70)
-                still_works = daily_return > 0
+                functional = bool(still_works[i])
 
                 results.append({
                     'scenario': scenario,
-                    'daily_return': daily_return,
-                    'still_functional': still_works,
-                    'passed': still_works
+                    'daily_return': float(params[i]),
+                    'still_functional': functional,
+                    'passed': functional
                 })
 
-                print(f"   {scenario:<40} | Daily: {daily_return:>5.2f}% | "
-                      f"{'✅ Resilient' if still_works else '❌ Failed'}")
+                lines.append(f"   {scenario:<40} | Daily: {params[i]:>5.2f}% | "
+                             f"{'✅ Resilient' if functional else '❌ Failed'}")
 
         # Pass criteria
-        circuit_breakers_work = all(r.get('circuit_breaker_triggered', True) or r.get('loss_contained', True) for r in results)
-        system_resilient = sum(1 for r in results if r['passed']) >= len(results) * 0.8
+        circuit_breakers_work = bool(contained[is_crash].all())
+        system_resilient = bool(scenario_passed.sum() >= scenario_passed.size * 0.8)
 
         passed = circuit_breakers_work and system_resilient
 
-        print(f"\n📋 TEST RESULTS:")
-        self.print_result("Circuit breakers functional", circuit_breakers_work)
-        self.print_result("System resilient (≥80% scenarios)", system_resilient)
+        lines.append(f"\n📋 TEST RESULTS:")
+        lines.append(self.format_result("Circuit breakers functional", circuit_breakers_work))
+        lines.append(self.format_result("System resilient (≥80% scenarios)", system_resilient))
 
         if passed:
-            print(f"\n✅ TEST 3 PASSED: System handles EXTREME stress scenarios")
+            lines.append(f"\n✅ TEST 3 PASSED: System handles EXTREME stress scenarios")
         else:
-            print(f"\n❌ TEST 3 FAILED: System vulnerable to stress conditions")
+            lines.append(f"\n❌ TEST 3 FAILED: System vulnerable to stress conditions")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        self.audit_results['stress_testing'] = {
-            'passed': passed,
+        result = TestResult('stress_testing', passed, {
             'results': results
-        }
+        })
+        self.audit_results.append(result)
 
-        return self.audit_results['stress_testing']
+        return result
 
-    def test_4_win_rate_stability(self) -> Dict:
+    def test_4_win_rate_stability(self) -> TestResult:
         """
         TEST 4: Win Rate Stability
         Ensure win rate remains consistent over time
         """
-        self.print_header("TEST 4: WIN RATE STABILITY")
+        lines = self.format_header("TEST 4: WIN RATE STABILITY")
 
-        print("\nTesting win rate stability across 30 days...")
-        print("Goal: Verify win rate doesn't degrade over time\n")
+        lines.append("\nTesting win rate stability across 30 days...")
+        lines.append("Goal: Verify win rate doesn't degrade over time\n")
 
-        # Simulate daily win rates
+        # Simulate daily win rates with realistic daily variation (3% std dev),
+        # bounded between 55-85%
         base_wr = 0.714
-        daily_win_rates = []
-
-        for day in range(1, 31):
-            # Add realistic daily variation
-            variation = np.random.normal(0, 0.03)  # 3% std dev
-            daily_wr = base_wr + variation
-            daily_wr = max(0.55, min(0.85, daily_wr))  # Bound between 55-85%
+        n_days = 30
+        normal = self.rng.normal
+        daily_win_rates = np.clip(base_wr + normal(0, 0.03, n_days), 0.55, 0.85)
 
-            daily_win_rates.append(daily_wr)
-
-        # Calculate rolling averages
-        window = 7
-        rolling_avg = [np.mean(daily_win_rates[max(0, i-window):i+1]) for i in range(len(daily_win_rates))]
-
-        # Check for trends
-        first_week = np.mean(daily_win_rates[:7])
-        last_week = np.mean(daily_win_rates[-7:])
+        # Check for trends: weeks 1-3 are consecutive, week 4 is the last 7 days
+        first_week, second_week, third_week = daily_win_rates[:21].reshape(3, 7).mean(axis=1)
+        last_week = daily_win_rates[-7:].mean()
         degradation = first_week - last_week
+        mean_wr = float(daily_win_rates.mean())
+        std_wr = float(daily_win_rates.std())
 
-        print(f"   Week 1 Avg:         {first_week*100:>6.2f}%")
-        print(f"   Week 2 Avg:         {np.mean(daily_win_rates[7:14])*100:>6.2f}%")
-        print(f"   Week 3 Avg:         {np.mean(daily_win_rates[14:21])*100:>6.2f}%")
-        print(f"   Week 4 Avg:         {last_week*100:>6.2f}%")
-        print(f"\n   Overall Avg:        {np.mean(daily_win_rates)*100:>6.2f}%")
-        print(f"   Std Deviation:      {np.std(daily_win_rates)*100:>6.2f}%")
-        print(f"   Degradation:        {degradation*100:>+6.2f}%")
+        lines.append(f"   Week 1 Avg:         {first_week*100:>6.2f}%")
+        lines.append(f"   Week 2 Avg:         {second_week*100:>6.2f}%")
+        lines.append(f"   Week 3 Avg:         {third_week*100:>6.2f}%")
+        lines.append(f"   Week 4 Avg:         {last_week*100:>6.2f}%")
+        lines.append(f"\n   Overall Avg:        {mean_wr*100:>6.2f}%")
+        lines.append(f"   Std Deviation:      {std_wr*100:>6.2f}%")
+        lines.append(f"   Degradation:        {degradation*100:>+6.2f}%")
 
         # Pass criteria
-        avg_above_65 = np.mean(daily_win_rates) >= 0.65
-        stable_variance = np.std(daily_win_rates) < 0.05  # <5% std dev
-        no_degradation = degradation < 0.05  # <5% drop
+        avg_above_65 = mean_wr >= 0.65
+        stable_variance = std_wr < 0.05  # <5% std dev
+        no_degradation = bool(degradation < 0.05)  # <5% drop
 
         passed = avg_above_65 and stable_variance and no_degradation
 
-        print(f"\n📋 TEST RESULTS:")
-        self.print_result("Average WR ≥65%", avg_above_65, f"{np.mean(daily_win_rates)*100:.2f}%")
-        self.print_result("Stable variance (<5% std)", stable_variance, f"{np.std(daily_win_rates)*100:.2f}%")
-        self.print_result("No degradation (<5% drop)", no_degradation, f"{degradation*100:+.2f}%")
+        lines.append(f"\n📋 TEST RESULTS:")
+        lines.append(self.format_result("Average WR ≥65%", avg_above_65, f"{mean_wr*100:.2f}%"))
+        lines.append(self.format_result("Stable variance (<5% std)", stable_variance, f"{std_wr*100:.2f}%"))
+        lines.append(self.format_result("No degradation (<5% drop)", no_degradation, f"{degradation*100:+.2f}%"))
 
         if passed:
-            print(f"\n✅ TEST 4 PASSED: Win rate is STABLE over time")
+            lines.append(f"\n✅ TEST 4 PASSED: Win rate is STABLE over time")
         else:
-            print(f"\n❌ TEST 4 FAILED: Win rate shows instability or degradation")
+            lines.append(f"\n❌ TEST 4 FAILED: Win rate shows instability or degradation")
 
-        self.audit_results['win_rate_stability'] = {
-            'passed': passed,
-            'avg_wr': np.mean(daily_win_rates),
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        result = TestResult('win_rate_stability', passed, {
+            'avg_wr': mean_wr,
             'stability': stable_variance
-        }
+        })
+        self.audit_results.append(result)
 
-        return self.audit_results['win_rate_stability']
+        return result
 
-    def test_5_drawdown_behavior(self) -> Dict:
+    def test_5_drawdown_behavior(self) -> TestResult:
         """
         TEST 5: Drawdown Behavior
         Analyze drawdown patterns and recovery
         """
-        self.print_header("TEST 5: DRAWDOWN BEHAVIOR")
+        lines = self.format_header("TEST 5: DRAWDOWN BEHAVIOR")
 
-        print("\nAnalyzing drawdown patterns and recovery times...")
-        print("Goal: Verify drawdowns are controlled and recoverable\n")
+        lines.append("\nAnalyzing drawdown patterns and recovery times...")
+        lines.append("Goal: Verify drawdowns are controlled and recoverable\n")
 
         # Simulate equity curve with drawdowns
-        equity = [self.initial_capital]
-        daily_return_base = 0.077  # 7.7%
+        uniform, rand = self.rng.uniform, self.rng.random
+        n_days = 30
 
-        for day in range(1, 31):
-            # Simulate daily return with occasional drawdowns
-            if np.random.random() < 0.15:  # 15% chance of losing day
-                daily_return = np.random.uniform(-0.03, 0)  # 0 to -3% loss
-            else:
-                daily_return = np.random.uniform(0.05, 0.10)  # 5-10% gain
+        # Daily returns with occasional drawdowns, all 30 days at once
+        loss_days = rand(n_days) < 0.15  # 15% chance of losing day
+        losses = uniform(-0.03, 0, n_days)  # 0 to -3% loss
+        gains = uniform(0.05, 0.10, n_days)  # 5-10% gain
+        daily_returns = np.where(loss_days, losses, gains)
 
-            equity.append(equity[-1] * (1 + daily_return))
+        equity = self.initial_capital * np.concatenate(([1.0], np.cumprod(1 + daily_returns)))
 
         # Calculate drawdowns
-        peak = equity[0]
-        drawdowns = []
-        recovery_times = []
-        in_drawdown = False
-        dd_start = 0
-
-        for i, value in enumerate(equity):
-            if value > peak:
-                # New peak
-                if in_drawdown:
-                    # Recovered
-                    recovery_times.append(i - dd_start)
-                    in_drawdown = False
-                peak = value
-            else:
-                # Drawdown
-                dd_pct = ((peak - value) / peak) * 100
-                drawdowns.append(dd_pct)
-
-                if not in_drawdown and dd_pct > 2:  # Significant drawdown
-                    in_drawdown = True
-                    dd_start = i
-
-        max_dd = max(drawdowns) if drawdowns else 0
-        avg_dd = np.mean(drawdowns) if drawdowns else 0
-        avg_recovery = np.mean(recovery_times) if recovery_times else 0
+        max_dd, avg_dd, n_severe, n_recoveries, avg_recovery = _scan_drawdowns(equity)
+        n_sig = int(n_severe)
 
-        print(f"   Max Drawdown:       {max_dd:>6.2f}%")
-        print(f"   Avg Drawdown:       {avg_dd:>6.2f}%")
-        print(f"   Drawdown Events:    {len([d for d in drawdowns if d > 5]):>6}")
-        print(f"   Avg Recovery Time:  {avg_recovery:>6.1f} days")
-        print(f"   Recovery Rate:      {(len(recovery_times)/max(1, len([d for d in drawdowns if d > 5])))*100:>6.1f}%")
+        lines.append(f"   Max Drawdown:       {max_dd:>6.2f}%")
+        lines.append(f"   Avg Drawdown:       {avg_dd:>6.2f}%")
+        lines.append(f"   Drawdown Events:    {n_sig:>6}")
+        lines.append(f"   Avg Recovery Time:  {avg_recovery:>6.1f} days")
+        lines.append(f"   Recovery Rate:      {(n_recoveries/max(1, n_sig))*100:>6.1f}%")
 
         # Pass criteria
-        max_dd_acceptable = max_dd < 15  # <15% max drawdown
-        avg_dd_low = avg_dd < 5  # <5% average drawdown
-        quick_recovery = avg_recovery < 5  # <5 days average recovery
+        max_dd_acceptable = bool(max_dd < 15)  # <15% max drawdown
+        avg_dd_low = bool(avg_dd < 5)  # <5% average drawdown
+        quick_recovery = bool(avg_recovery < 5)  # <5 days average recovery
 
         passed = max_dd_acceptable and avg_dd_low
 
-        print(f"\n📋 TEST RESULTS:")
-        self.print_result("Max drawdown <15%", max_dd_acceptable, f"{max_dd:.2f}%")
-        self.print_result("Avg drawdown <5%", avg_dd_low, f"{avg_dd:.2f}%")
-        self.print_result("Quick recovery (<5 days)", quick_recovery, f"{avg_recovery:.1f} days")
+        lines.append(f"\n📋 TEST RESULTS:")
+        lines.append(self.format_result("Max drawdown <15%", max_dd_acceptable, f"{max_dd:.2f}%"))
+        lines.append(self.format_result("Avg drawdown <5%", avg_dd_low, f"{avg_dd:.2f}%"))
+        lines.append(self.format_result("Quick recovery (<5 days)", quick_recovery, f"{avg_recovery:.1f} days"))
 
         if passed:
-            print(f"\n✅ TEST 5 PASSED: Drawdowns are CONTROLLED and recoverable")
+            lines.append(f"\n✅ TEST 5 PASSED: Drawdowns are CONTROLLED and recoverable")
         else:
-            print(f"\n❌ TEST 5 FAILED: Drawdowns are excessive or recovery is slow")
+            lines.append(f"\n❌ TEST 5 FAILED: Drawdowns are excessive or recovery is slow")
 
-        self.audit_results['drawdown_behavior'] = {
-            'passed': passed,
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        result = TestResult('drawdown_behavior', passed, {
             'max_dd': max_dd,
             'avg_dd': avg_dd
-        }
+        })
+        self.audit_results.append(result)
 
-        return self.audit_results['drawdown_behavior']
+        return result
 
-    def test_6_long_term_sustainability(self) -> Dict:
+    def test_6_long_term_sustainability(self) -> TestResult:
         """
         TEST 6: Long-term Sustainability
         Test 6-month performance to ensure sustainability
         """
-        self.print_header("TEST 6: LONG-TERM SUSTAINABILITY")
+        lines = self.format_header("TEST 6: LONG-TERM SUSTAINABILITY")
 
-        print("\nTesting 6-month performance projection...")
-        print("Goal: Verify system remains profitable long-term\n")
+        lines.append("\nTesting 6-month performance projection...")
+        lines.append("Goal: Verify system remains profitable long-term\n")
 
         # Simulate 6 months with natural performance decay
-        monthly_results = []
-        cumulative_capital = self.initial_capital
-
-        for month in range(1, 7):
-            # Performance decay over time (strategies get arbitraged)
-            decay_factor = 0.95 ** (month - 1)  # 5% decay per month
-            monthly_return_pct = 7.70 * 30 * decay_factor  # Adjust daily to monthly
-
-            # But compounding helps
-            month_multiplier = ((1 + (7.70 * decay_factor)/100) ** 30)
-            month_capital = cumulative_capital * month_multiplier
-
-            profit = month_capital - cumulative_capital
-            cumulative_capital = month_capital
-
-            monthly_results.append({
-                'month': month,
-                'return_pct': (month_multiplier - 1) * 100,
-                'capital': month_capital,
-                'profit': profit
-            })
-
-            print(f"   Month {month}: ${month_capital:>10,.2f} | "
-                  f"Monthly: {(month_multiplier - 1)*100:>6.1f}% | "
-                  f"Profit: ${profit:>+8,.2f}")
+        n_months = 6
+
+        # Performance decay over time (strategies get arbitraged), 5% per month
+        decay_factors = np.power(0.95, np.arange(n_months))
+
+        # But compounding helps
+        month_multipliers = np.power(1 + (7.70 * decay_factors)/100, 30)
+        return_pcts = (month_multipliers - 1) * 100
+        capital = self.initial_capital * np.cumprod(month_multipliers)
+        profits = np.diff(capital, prepend=self.initial_capital)
+
+        for i in range(n_months):
+            lines.append(f"   Month {i + 1}: ${capital[i]:>10,.2f} | "
+                         f"Monthly: {return_pcts[i]:>6.1f}% | "
+                         f"Profit: ${profits[i]:>+8,.2f}")
+
+        monthly_results = [
+            {'month': month, 'return_pct': return_pct, 'capital': month_capital, 'profit': profit}
+            for month, return_pct, month_capital, profit in zip(
+                range(1, n_months + 1), return_pcts.tolist(), capital.tolist(), profits.tolist())
+        ]
 
         # Check sustainability
-        final_capital = monthly_results[-1]['capital']
+        final_capital = float(capital[-1])
         total_return = ((final_capital - self.initial_capital) / self.initial_capital) * 100
 
-        still_profitable = all(r['return_pct'] > 0 for r in monthly_results)
-        declining_but_positive = all(r['profit'] > 0 for r in monthly_results)
+        still_profitable = bool((return_pcts > 0).all())
+        declining_but_positive = bool((profits > 0).all())
         sustainable = final_capital > self.initial_capital * 5  # 5x in 6 months
 
-        print(f"\n📊 6-MONTH SUMMARY:")
-        print(f"   Starting Capital:   ${self.initial_capital:>10,.2f}")
-        print(f"   Ending Capital:     ${final_capital:>10,.2f}")
-        print(f"   Total Return:       {total_return:>10.1f}%")
-        print(f"   Avg Monthly:        {np.mean([r['return_pct'] for r in monthly_results]):>10.1f}%")
+        lines.append(f"\n📊 6-MONTH SUMMARY:")
+        lines.append(f"   Starting Capital:   ${self.initial_capital:>10,.2f}")
+        lines.append(f"   Ending Capital:     ${final_capital:>10,.2f}")
+        lines.append(f"   Total Return:       {total_return:>10.1f}%")
+        lines.append(f"   Avg Monthly:        {return_pcts.mean():>10.1f}%")
 
         passed = still_profitable and sustainable
 
-        print(f"\n📋 TEST RESULTS:")
-        self.print_result("All months profitable", still_profitable)
-        self.print_result("Declining but positive", declining_but_positive)
-        self.print_result("Sustainable (≥5x in 6mo)", sustainable, f"{final_capital/self.initial_capital:.1f}x")
+        lines.append(f"\n📋 TEST RESULTS:")
+        lines.append(self.format_result("All months profitable", still_profitable))
+        lines.append(self.format_result("Declining but positive", declining_but_positive))
+        lines.append(self.format_result("Sustainable (≥5x in 6mo)", sustainable, f"{final_capital/self.initial_capital:.1f}x"))
 
         if passed:
-            print(f"\n✅ TEST 6 PASSED: System is SUSTAINABLE long-term")
+            lines.append(f"\n✅ TEST 6 PASSED: System is SUSTAINABLE long-term")
         else:
-            print(f"\n❌ TEST 6 FAILED: System shows unsustainable performance decay")
+            lines.append(f"\n❌ TEST 6 FAILED: System shows unsustainable performance decay")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        self.audit_results['long_term'] = {
-            'passed': passed,
+        result = TestResult('long_term', passed, {
+            'monthly_results': monthly_results,
             'final_capital': final_capital,
             'sustainable': sustainable
-        }
+        })
+        self.audit_results.append(result)
+
+        return result
 
-        return self.audit_results['long_term']
+    def run_full_audit(self, processes: Optional[int] = None) -> List[TestResult]:
+        """
+        Run complete forensic audit
 
-    def run_full_audit(self) -> Dict:
-        """Run complete forensic audit"""
+        Args:
+            processes: Worker processes for the (independent) tests; 1 runs
+                       them in this process. Default: one per test, up to
+                       the CPU count.
+        """
 
-        print("\n" + "╔" + "=" * 98 + "╗")
-        print("║" + " 🔬 FORENSIC STABILITY & CONSISTENCY AUDIT 🔬".center(98) + "║")
-        print("║" + " Nuclear Swarm System Validation".center(98) + "║")
-        print("╚" + "=" * 98 + "╝")
+        print(AUDIT_BANNER)
 
         # Run all tests
-        tests = [
-            self.test_1_multi_period_consistency,
-            self.test_2_market_regime_testing,
-            self.test_3_stress_testing,
-            self.test_4_win_rate_stability,
-            self.test_5_drawdown_behavior,
-            self.test_6_long_term_sustainability
-        ]
+        tests = self.TEST_METHODS
+
+        if processes is None:
+            processes = min(len(tests), os.cpu_count() or 1)
 
-        for test in tests:
-            test()
+        # Independent child stream per test, so a seeded audit reproduces
+        # the same numbers whether the tests run in-process or in parallel
+        test_seeds = np.random.SeedSequence(self.seed).spawn(len(tests))
+
+        if processes <= 1:
+            for name, test_seed in zip(tests, test_seeds):
+                self.rng = np.random.default_rng(test_seed)
+                getattr(self, name)()
+        else:
+            # Each test runs on a fresh audit in the worker; its report is
+            # captured there and printed here in test order
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [executor.submit(_run_test_captured, self.initial_capital, name, test_seed)
+                           for name, test_seed in zip(tests, test_seeds)]
+                for future in futures:
+                    result, output = future.result()
+                    sys.stdout.write(output)
+                    self.audit_results.append(result)
 
         # Print final summary
         self.print_final_summary()
@@ -575,48 +682,43 @@ class ForensicStabilityAudit:
     def print_final_summary(self):
         """Print final audit summary"""
 
-        print("\n" + "=" * 100)
-        print("📊 FORENSIC AUDIT - FINAL SUMMARY")
-        print("=" * 100)
-
-        tests_passed = sum(1 for result in self.audit_results.values() if result['passed'])
+        tests_passed = sum(result.passed for result in self.audit_results)
         total_tests = len(self.audit_results)
-
-        print(f"\n🎯 OVERALL RESULTS:")
-        print(f"   Tests Passed:        {tests_passed} / {total_tests}")
-        print(f"   Success Rate:        {(tests_passed/total_tests)*100:.1f}%")
-
-        print(f"\n📋 TEST BREAKDOWN:")
-        for i, (test_name, result) in enumerate(self.audit_results.items(), 1):
-            status = "✅ PASS" if result['passed'] else "❌ FAIL"
-            print(f"   Test {i} - {test_name:<25} {status}")
-
-        print("\n" + "=" * 100)
-
-        if tests_passed == total_tests:
-            print("✅ FORENSIC AUDIT COMPLETE: SYSTEM FULLY VALIDATED")
-            print("   • STABLE across all time periods")
-            print("   • CONSISTENT across market conditions")
-            print("   • RESILIENT to stress scenarios")
-            print("   • CONTROLLED risk management")
-            print("   • SUSTAINABLE long-term performance")
-            print("\n🚀 SYSTEM IS READY FOR DEPLOYMENT")
-
-        elif tests_passed >= total_tests * 0.80:
-            print("⚠️ FORENSIC AUDIT COMPLETE: SYSTEM MOSTLY VALIDATED")
-            print("   • Most tests passed")
-            print("   • Some areas need attention")
-            print("   • Review failed tests before deployment")
-            print("\n⏳ PROCEED WITH CAUTION")
-
-        else:
-            print("❌ FORENSIC AUDIT COMPLETE: SYSTEM NEEDS IMPROVEMENT")
-            print("   • Multiple critical failures")
-            print("   • System not ready for deployment")
-            print("   • Requires parameter tuning and testing")
-            print("\n🛑 DO NOT DEPLOY YET")
-
-        print("=" * 100 + "\n")
+        breakdown = "\n".join(
+            f"   Test {i} - {result.name:<25} {'✅ PASS' if result.passed else '❌ FAIL'}"
+            for i, result in enumerate(self.audit_results, 1)
+        )
+        verdict = next(text for min_ratio, text in SUMMARY_VERDICTS
+                       if tests_passed >= total_tests * min_ratio)
+
+        sys.stdout.write(f"""
+{SEP100}
+📊 FORENSIC AUDIT - FINAL SUMMARY
+{SEP100}
+
+🎯 OVERALL RESULTS:
+   Tests Passed:        {tests_passed} / {total_tests}
+   Success Rate:        {(tests_passed/total_tests)*100:.1f}%
+
+📋 TEST BREAKDOWN:
+{breakdown}
+
+{SEP100}
+{verdict}
+{SEP100}
+
+""")
+
+
+def _run_test_captured(initial_capital: float, name: str,
+                       seed: np.random.SeedSequence) -> Tuple[TestResult, str]:
+    """Run one named audit test in a worker, returning its results and printed report"""
+    audit = ForensicStabilityAudit(initial_capital)
+    audit.rng = np.random.default_rng(seed)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = getattr(audit, name)()
+    return result, output.getvalue()
 
 
 def main():
@@ -5,16 +5,180 @@ Handles all Bybit REST API interactions
 
 import hashlib
 import hmac
+import json
+import socket
+import ssl
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlencode
 import requests
-from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+from decimal import Decimal
+
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import httptools
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+# Keyword for a pre-serialized request body (httpx: content=, requests: data=)
+_BODY_ARG = 'content' if HTTP2_AVAILABLE else 'data'
+
+
+def _decimal_str(value: float) -> str:
+    """Plain decimal string for a quantity/price (str(1e-05) would be '1e-05', which v5 rejects)"""
+    return format(Decimal(repr(value)), 'f')
+
+
+class TokenBucket:
+    """Thread-safe token bucket: bursts up to `burst` calls, refilled at `rate` per second"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping only for the deficit when the bucket is empty"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                deficit = (1 - self._tokens) / self.rate
+
+            time.sleep(deficit)
+
+
+class _ResponseCollector:
+    """httptools parser callbacks: collect the body and flag completion"""
+
+    __slots__ = ('chunks', 'done', 'close')
+
+    def __init__(self):
+        self.chunks = []
+        self.done = False
+        self.close = False  # Server sent Connection: close
+
+    def on_header(self, name: bytes, value: bytes):
+        if name.lower() == b'connection':
+            self.close = value.lower() == b'close'
+
+    def on_body(self, body: bytes):
+        self.chunks.append(body)
+
+    def on_message_complete(self):
+        self.done = True
+
+
+class RawHTTPSConnection:
+    """Persistent HTTP/1.1-over-TLS socket that sends pre-rendered request bytes"""
+
+    IDLE_RECONNECT = 20.0  # Seconds idle before reconnecting instead of reusing the socket
+
+    def __init__(self, host: str, timeout: float = 10.0):
+        self.host = host
+        self.timeout = timeout
+        self._ssl_context = ssl.create_default_context()
+        self._sock = None
+        self._last_used = 0.0
+        self._heads: Dict[str, bytes] = {}  # path -> request line + Host header
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open the TCP connection (Nagle off) and complete the TLS handshake"""
+        raw = socket.create_connection((self.host, 443), timeout=self.timeout)
+        raw.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = self._ssl_context.wrap_socket(raw, server_hostname=self.host)
+
+    def close(self):
+        """Close the socket; the next request reconnects"""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    def post(self, path: str, headers: bytes, body: bytes) -> Tuple[int, bytes]:
+        """
+        Send one POST and read the full response
+
+        A failed request is never resent, since orders are not idempotent.
+
+        Args:
+            path: Request path
+            headers: Pre-rendered header lines, each ending in CRLF
+            body: Request body
+
+        Returns:
+            (status code, response body)
+        """
+        head = self._heads.get(path)
+        if head is None:
+            head = self._heads[path] = b"POST %s HTTP/1.1\r\nHost: %s\r\n" % (
+                path.encode('ascii'), self.host.encode('ascii'))
+
+        request = b''.join((head, headers, b"Content-Length: %d\r\n\r\n" % len(body), body))
+
+        with self._lock:
+            # The server may have dropped an idle keep-alive socket; don't send an order into it
+            if self._sock is not None and time.monotonic() - self._last_used > self.IDLE_RECONNECT:
+                self.close()
+            if self._sock is None:
+                self._connect()
+
+            try:
+                self._sock.sendall(request)
+
+                collector = _ResponseCollector()
+                parser = httptools.HttpResponseParser(collector)
+                while not collector.done:
+                    data = self._sock.recv(65536)
+                    if not data:
+                        raise ConnectionError("Connection closed before response completed")
+                    parser.feed_data(data)
+            except Exception:
+                self.close()
+                raise
+
+            self._last_used = time.monotonic()
+            if collector.close:
+                self.close()
+
+        return parser.get_status_code(), b''.join(collector.chunks)
 
 
 class BybitConnector:
     """Bybit API connector with full trading capabilities"""
 
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        testnet: bool = True,
+        category: str = 'linear',
+        recv_window: int = 5000,
+        ticker_cache_ttl: float = 0.1,
+        funding_cache_ttl: float = 1.0
+    ):
         """
         Initialize Bybit connector
 
@@ -22,37 +186,93 @@ class BybitConnector:
             api_key: Bybit API key
             api_secret: Bybit API secret
             testnet: Use testnet (True) or live (False)
+            category: v5 product category ('linear' for USDT perpetuals)
+            recv_window: Milliseconds a signed request stays valid
+            ticker_cache_ttl: Seconds to reuse a ticker response (0 disables)
+            funding_cache_ttl: Seconds to reuse a funding rate response (0 disables)
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
+        self.category = category
+        self.recv_window = str(recv_window)
+
+        # Keyed HMAC state, derived once and copied per signature
+        self._hmac_proto = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
 
         # API endpoints
         if testnet:
-            self.base_url = "https://api-testnet.bybit.com"
+            self.host = "api-testnet.bybit.com"
         else:
-            self.base_url = "https://api.bybit.com"
-
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.5  # 500ms between requests
+            self.host = "api.bybit.com"
+        self.base_url = f"https://{self.host}"
+
+        # Rate limiting: token buckets per endpoint class (orders have their own budget)
+        self.rate_limiters = {
+            'public': TokenBucket(rate=20, burst=10),
+            'private': TokenBucket(rate=20, burst=10),
+            'order': TokenBucket(rate=10, burst=10)
+        }
 
-        print(f"✅ Bybit Connector initialized ({'TESTNET' if testnet else 'LIVE'})")
+        # Short-lived caches for public data: symbol -> (expires_at, data)
+        self.ticker_cache_ttl = ticker_cache_ttl
+        self.funding_cache_ttl = funding_cache_ttl
+        self._ticker_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._funding_cache: Dict[str, Tuple[float, Dict]] = {}
+
+        # Pooled keep-alive session: TCP/TLS setup is paid once, not per call.
+        # With httpx installed, requests multiplex over one HTTP/2 connection.
+        self.session = self._create_session()
+        self._executor: Optional[ThreadPoolExecutor] = None  # Created on first fetch_snapshot
+
+        # Orders skip the HTTP client: with httptools installed they are sent as
+        # pre-rendered bytes over a raw keep-alive TLS socket
+        self._order_conn = RawHTTPSConnection(self.host) if HTTPTOOLS_AVAILABLE else None
+        self._order_headers = b"Content-Type: application/json\r\nX-BAPI-API-KEY: %s\r\nX-BAPI-RECV-WINDOW: %s\r\n" % (
+            api_key.encode('utf-8'), self.recv_window.encode('ascii'))
+
+        print(f"✅ Bybit Connector initialized ({'TESTNET' if testnet else 'LIVE'}, "
+              f"{'HTTP/2' if HTTP2_AVAILABLE else 'HTTP/1.1'})")
+
+    @staticmethod
+    def _create_session():
+        """Create the HTTP session (HTTP/2 via httpx if available, else requests)"""
+        if HTTP2_AVAILABLE:
+            # Transport retries cover connection failures only
+            return httpx.Client(
+                timeout=10.0,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+                )
+            )
+
+        # Retry only covers idempotent methods, so orders are never resent
+        session = requests.Session()
+        session.headers.update({'Connection': 'keep-alive'})
+        session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        return session
+
+    def _generate_signature(self, timestamp: str, payload: str) -> str:
+        """
+        Generate the v5 HMAC SHA256 signature
 
-    def _generate_signature(self, params: Dict) -> str:
-        """Generate HMAC SHA256 signature for Bybit API"""
-        # Sort parameters alphabetically
-        sorted_params = sorted(params.items())
-        param_string = '&'.join([f"{k}={v}" for k, v in sorted_params])
+        Args:
+            timestamp: Request timestamp in milliseconds
+            payload: Query string (GET) or JSON body (POST), exactly as sent
 
-        # Generate signature
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            param_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        Returns:
+            Hex signature for the X-BAPI-SIGN header
+        """
+        h = self._hmac_proto.copy()
+        h.update(f"{timestamp}{self.api_key}{self.recv_window}{payload}".encode('utf-8'))
 
-        return signature
+        return h.hexdigest()
 
     def _make_request(self, method: str, endpoint: str, params: Dict = None, signed: bool = True) -> Dict:
         """
@@ -70,58 +290,111 @@ class BybitConnector:
         if params is None:
             params = {}
 
-        # Add timestamp and API key for signed requests
-        if signed:
-            timestamp = str(int(time.time() * 1000))
-            params['api_key'] = self.api_key
-            params['timestamp'] = timestamp
-
-            # Generate signature
-            params['sign'] = self._generate_signature(params)
-
-        # Rate limiting
-        time_since_last_request = time.time() - self.last_request_time
-        if time_since_last_request < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last_request)
+        # Rate limiting (before signing, so the timestamp is fresh)
+        if not signed:
+            self.rate_limiters['public'].acquire()
+        elif '/order/' in endpoint:
+            self.rate_limiters['order'].acquire()
+        else:
+            self.rate_limiters['private'].acquire()
 
-        # Make request
+        # Serialize once: the signature covers the exact bytes that are sent
         url = f"{self.base_url}{endpoint}"
+        headers = {}
 
         try:
             if method == "GET":
-                response = requests.get(url, params=params, timeout=10)
+                payload = urlencode(params)
+                if payload:
+                    url = f"{url}?{payload}"
             elif method == "POST":
-                response = requests.post(url, json=params, timeout=10)
+                payload = json.dumps(params, separators=(',', ':'))
+                headers['Content-Type'] = 'application/json'
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
-            self.last_request_time = time.time()
+            # v5 auth travels in headers; params are never mutated
+            if signed:
+                timestamp = str(time.time_ns() // 1_000_000)
+                headers['X-BAPI-API-KEY'] = self.api_key
+                headers['X-BAPI-SIGN'] = self._generate_signature(timestamp, payload)
+                headers['X-BAPI-TIMESTAMP'] = timestamp
+                headers['X-BAPI-RECV-WINDOW'] = self.recv_window
+
+            if method == "GET":
+                response = self.session.get(url, headers=headers, timeout=10)
+            else:
+                response = self.session.post(url, headers=headers, timeout=10, **{_BODY_ARG: payload})
 
             # Parse response
-            data = response.json()
+            return self._check_response(response.json())
+
+        except Exception as e:
+            print(f"❌ Request failed: {str(e)}")
+            return None
+
+    def _post_order(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """
+        Send a signed order request over the raw TLS connection
+
+        Falls back to _make_request when httptools is not installed.
+
+        Args:
+            endpoint: API endpoint
+            params: Request parameters
+
+        Returns:
+            API response as dict
+        """
+        if self._order_conn is None:
+            return self._make_request("POST", endpoint, params)
 
-            if data.get('ret_code') != 0 and data.get('retCode') != 0:
-                print(f"❌ Bybit API Error: {data.get('ret_msg') or data.get('retMsg')}")
-                return None
+        self.rate_limiters['order'].acquire()
 
-            return data
+        body = json.dumps(params, separators=(',', ':'))
+        timestamp = str(time.time_ns() // 1_000_000)
+        headers = self._order_headers + b"X-BAPI-TIMESTAMP: %s\r\nX-BAPI-SIGN: %s\r\n" % (
+            timestamp.encode('ascii'), self._generate_signature(timestamp, body).encode('ascii'))
 
+        try:
+            _, raw = self._order_conn.post(endpoint, headers, body.encode('utf-8'))
+            return self._check_response(json.loads(raw))
         except Exception as e:
             print(f"❌ Request failed: {str(e)}")
             return None
 
+    @staticmethod
+    def _check_response(data: Dict) -> Optional[Dict]:
+        """Return the response, or None (with the error printed) when retCode is non-zero"""
+        if data.get('retCode') != 0:
+            print(f"❌ Bybit API Error: {data.get('retMsg')}")
+            return None
+        return data
+
+    def close(self):
+        """Close pooled HTTP connections, the order socket and the snapshot worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._order_conn is not None:
+            self._order_conn.close()
+        self.session.close()
+
     def get_account_balance(self) -> Optional[Dict]:
         """Get account balance"""
-        endpoint = "/v2/private/wallet/balance"
-        params = {'coin': 'USDT'}
+        endpoint = "/v5/account/wallet-balance"
+        params = {'accountType': 'UNIFIED', 'coin': 'USDT'}
 
         response = self._make_request("GET", endpoint, params)
-        if response and response.get('result'):
-            balance_data = response['result'].get('USDT', {})
+        if response and response.get('result', {}).get('list'):
+            account = response['result']['list'][0]
+            balance_data = next((c for c in account.get('coin', []) if c.get('coin') == 'USDT'), {})
+            # v5 sends '' for fields that do not apply to the account type
             return {
-                'total_balance': float(balance_data.get('wallet_balance', 0)),
-                'available_balance': float(balance_data.get('available_balance', 0)),
-                'used_margin': float(balance_data.get('used_margin', 0))
+                'total_balance': float(balance_data.get('walletBalance') or 0),
+                'available_balance': float(account.get('totalAvailableBalance') or 0),
+                'used_margin': float(balance_data.get('totalPositionIM') or 0)
+                               + float(balance_data.get('totalOrderIM') or 0)
             }
         return None
 
@@ -135,24 +408,26 @@ class BybitConnector:
         Returns:
             List of position dictionaries
         """
-        endpoint = "/v2/private/position/list"
-        params = {}
+        endpoint = "/v5/position/list"
+        params = {'category': self.category}
         if symbol:
             params['symbol'] = symbol
+        else:
+            params['settleCoin'] = 'USDT'  # v5 needs a symbol or settle coin
 
         response = self._make_request("GET", endpoint, params)
         if response and response.get('result'):
             positions = []
-            for pos in response['result']:
-                if float(pos.get('size', 0)) > 0:
+            for pos in response['result'].get('list', []):
+                if float(pos.get('size') or 0) > 0:
                     positions.append({
                         'symbol': pos['symbol'],
                         'side': pos['side'],
                         'size': float(pos['size']),
-                        'entry_price': float(pos['entry_price']),
+                        'entry_price': float(pos['avgPrice']),
                         'leverage': float(pos['leverage']),
-                        'unrealized_pnl': float(pos.get('unrealised_pnl', 0)),
-                        'liquidation_price': float(pos.get('liq_price', 0))
+                        'unrealized_pnl': float(pos.get('unrealisedPnl') or 0),
+                        'liquidation_price': float(pos.get('liqPrice') or 0)
                     })
             return positions
         return []
@@ -180,29 +455,31 @@ class BybitConnector:
         Returns:
             Order response dict
         """
-        endpoint = "/v2/private/order/create"
+        endpoint = "/v5/order/create"
 
+        # v5 takes quantities and prices as strings
         params = {
+            'category': self.category,
             'symbol': symbol,
             'side': side,
-            'order_type': 'Market',
-            'qty': qty,
-            'time_in_force': 'ImmediateOrCancel',
-            'reduce_only': reduce_only,
-            'close_on_trigger': False
+            'orderType': 'Market',
+            'qty': _decimal_str(qty),
+            'timeInForce': 'IOC',
+            'reduceOnly': reduce_only,
+            'closeOnTrigger': False
         }
 
         if stop_loss:
-            params['stop_loss'] = stop_loss
+            params['stopLoss'] = _decimal_str(stop_loss)
         if take_profit:
-            params['take_profit'] = take_profit
+            params['takeProfit'] = _decimal_str(take_profit)
 
-        response = self._make_request("POST", endpoint, params)
+        response = self._post_order(endpoint, params)
 
         if response and response.get('result'):
             result = response['result']
             return {
-                'order_id': result.get('order_id'),
+                'order_id': result.get('orderId'),
                 'symbol': symbol,
                 'side': side,
                 'qty': qty,
@@ -221,12 +498,13 @@ class BybitConnector:
         Returns:
             Success status
         """
-        endpoint = "/v2/private/position/leverage/save"
+        endpoint = "/v5/position/set-leverage"
 
         params = {
+            'category': self.category,
             'symbol': symbol,
-            'buy_leverage': leverage,
-            'sell_leverage': leverage
+            'buyLeverage': str(leverage),
+            'sellLeverage': str(leverage)
         }
 
         response = self._make_request("POST", endpoint, params)
@@ -261,6 +539,20 @@ class BybitConnector:
 
         return None
 
+    @staticmethod
+    def _cache_get(cache: Dict[str, Tuple[float, Dict]], symbol: str) -> Optional[Dict]:
+        """Return a copy of a cached response if it has not expired"""
+        entry = cache.get(symbol)
+        if entry is not None and time.monotonic() < entry[0]:
+            return dict(entry[1])
+        return None
+
+    @staticmethod
+    def _cache_put(cache: Dict[str, Tuple[float, Dict]], symbol: str, data: Dict, ttl: float):
+        """Cache a response for ttl seconds (no-op when ttl <= 0)"""
+        if ttl > 0:
+            cache[symbol] = (time.monotonic() + ttl, dict(data))
+
     def get_ticker(self, symbol: str) -> Optional[Dict]:
         """
         Get latest ticker data
@@ -271,21 +563,27 @@ class BybitConnector:
         Returns:
             Ticker data dict
         """
-        endpoint = "/v2/public/tickers"
-        params = {'symbol': symbol}
+        cached = self._cache_get(self._ticker_cache, symbol)
+        if cached is not None:
+            return cached
+
+        endpoint = "/v5/market/tickers"
+        params = {'category': self.category, 'symbol': symbol}
 
         response = self._make_request("GET", endpoint, params, signed=False)
 
         if response and response.get('result'):
-            result = response['result'][0] if isinstance(response['result'], list) else response['result']
-            return {
+            result = response['result']['list'][0]
+            ticker = {
                 'symbol': symbol,
-                'last_price': float(result.get('last_price', 0)),
-                'bid': float(result.get('bid_price', 0)),
-                'ask': float(result.get('ask_price', 0)),
-                'volume_24h': float(result.get('volume_24h', 0)),
-                'price_change_pct': float(result.get('price_24h_pcnt', 0)) * 100
+                'last_price': float(result.get('lastPrice') or 0),
+                'bid': float(result.get('bid1Price') or 0),
+                'ask': float(result.get('ask1Price') or 0),
+                'volume_24h': float(result.get('volume24h') or 0),
+                'price_change_pct': float(result.get('price24hPcnt') or 0) * 100
             }
+            self._cache_put(self._ticker_cache, symbol, ticker, self.ticker_cache_ttl)
+            return ticker
         return None
 
     def get_funding_rate(self, symbol: str) -> Optional[Dict]:
@@ -298,21 +596,70 @@ class BybitConnector:
         Returns:
             Funding rate data
         """
-        endpoint = "/v2/public/tickers"
-        params = {'symbol': symbol}
+        cached = self._cache_get(self._funding_cache, symbol)
+        if cached is not None:
+            return cached
+
+        endpoint = "/v5/market/tickers"
+        params = {'category': self.category, 'symbol': symbol}
 
         response = self._make_request("GET", endpoint, params, signed=False)
 
         if response and response.get('result'):
-            result = response['result'][0] if isinstance(response['result'], list) else response['result']
-            return {
+            result = response['result']['list'][0]
+            # v5 reports one rate: the one applied at the next settlement
+            funding_rate = float(result.get('fundingRate') or 0)
+            funding = {
                 'symbol': symbol,
-                'funding_rate': float(result.get('funding_rate', 0)),
-                'predicted_funding_rate': float(result.get('predicted_funding_rate', 0)),
-                'next_funding_time': result.get('next_funding_time', '')
+                'funding_rate': funding_rate,
+                'predicted_funding_rate': funding_rate,
+                'next_funding_time': result.get('nextFundingTime', '')
             }
+            self._cache_put(self._funding_cache, symbol, funding, self.funding_cache_ttl)
+            return funding
         return None
 
+    def fetch_snapshot(
+        self,
+        symbols: List[str],
+        callback: Optional[Callable[[str, Any], None]] = None
+    ) -> Dict:
+        """
+        Fetch balance, positions and tickers concurrently over the pooled session
+
+        Args:
+            symbols: Symbols to fetch tickers for
+            callback: Optional callback(key, result) invoked as each call completes
+                      (key is 'balance', 'positions' or the symbol)
+
+        Returns:
+            {'balance': ..., 'positions': [...], 'tickers': {symbol: ...}}
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='bybit-rest')
+
+        futures = {
+            self._executor.submit(self.get_account_balance): 'balance',
+            self._executor.submit(self.get_positions): 'positions'
+        }
+        for symbol in symbols:
+            futures[self._executor.submit(self.get_ticker, symbol)] = symbol
+
+        snapshot = {'balance': None, 'positions': [], 'tickers': {}}
+        for future in as_completed(futures):
+            key = futures[future]
+            result = future.result()
+
+            if key in ('balance', 'positions'):
+                snapshot[key] = result
+            else:
+                snapshot['tickers'][key] = result
+
+            if callback:
+                callback(key, result)
+
+        return snapshot
+
     def test_connection(self) -> bool:
         """Test API connection and credentials"""
         print("\n🔍 Testing Bybit connection...")
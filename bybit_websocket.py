@@ -5,11 +5,132 @@ Real-time market data for high-frequency trading
 
 import asyncio
 import json
+import sys
 import websockets
 import time
+import numpy as np
 from typing import Dict, List, Callable, Optional
 from datetime import datetime
-from collections import defaultdict
+from dataclasses import dataclass
+from collections import defaultdict, deque
+from operator import neg
+from sortedcontainers import SortedDict
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+
+    json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import msgspec
+
+    class TickerFields(msgspec.Struct):
+        """instrument_info payload, decoded straight from JSON (no intermediate dict)"""
+        symbol: str
+        last_price_e4: float = 0.0
+        bid1_price_e4: float = 0.0
+        ask1_price_e4: float = 0.0
+        volume_24h_e8: float = 0.0
+        price_24h_pcnt_e6: float = 0.0
+        update_time_e6: float = 0.0
+
+    class FrameEnvelope(msgspec.Struct):
+        """Top-level frame; `data` stays raw JSON until its handler needs it"""
+        topic: Optional[str] = None
+        data: msgspec.Raw = msgspec.Raw()
+        success: bool = False
+        ret_msg: Optional[str] = None
+
+    _envelope_decoder = msgspec.json.Decoder(FrameEnvelope)
+    _ticker_decoder = msgspec.json.Decoder(TickerFields, strict=False)  # Accepts numeric strings
+    _payload_decoder = msgspec.json.Decoder()
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit('UniTuple(f8, 6)(f8, f8, f8, f8, f8, f8, f8)', cache=True)
+def _scale_ticker(last_e4, bid_e4, ask_e4, volume_e8, pcnt_e6, update_e6, receive_time):
+    """
+    Scale Bybit fixed-point ticker fields and compute feed latency
+
+    Returns: (last, bid, ask, volume_24h, price_change_pct, latency_ms)
+    """
+    update_time = update_e6 / 1_000_000
+    latency_ms = (receive_time - update_time) * 1000 if update_time > 0 else 0.0
+    return (last_e4 / 10000, bid_e4 / 10000, ask_e4 / 10000,
+            volume_e8 / 100_000_000, pcnt_e6 / 10000, latency_ms)
+
+
+@dataclass(slots=True)
+class Ticker:
+    """Latest ticker for a symbol"""
+    symbol: str
+    last_price: float
+    bid: float
+    ask: float
+    volume_24h: float
+    price_change_pct: float
+    timestamp: float
+    latency_ms: float
+
+
+@dataclass(slots=True)
+class OrderbookSnapshot:
+    """Top-of-book levels as (price, size) tuples, bids best-first"""
+    symbol: str
+    bids: tuple
+    asks: tuple
+    timestamp: Optional[float]
+
+
+@dataclass(slots=True)
+class Trade:
+    """Public trade"""
+    symbol: str
+    price: float
+    size: float
+    side: str
+    timestamp: float
+    trade_time: float
+
+
+@dataclass(slots=True)
+class Kline:
+    """Candlestick update"""
+    symbol: str
+    interval: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    timestamp: int
+    confirmed: bool
+
+
+# Subscription frame; topics are plain ASCII so only the topic is formatted in.
+# Kept as str so websockets sends a text frame, which is what Bybit expects
+_SUB_TMPL = '{"op":"subscribe","args":["%s"]}'
+
+# Ticks per unit price for symbols without a registered tick size (tick 1e-8)
+DEFAULT_PRICE_SCALE = 100_000_000
 
 
 class BybitWebSocket:
@@ -19,6 +140,9 @@ class BybitWebSocket:
         """
         Initialize Bybit WebSocket
 
+        Runs on whichever event loop drives it; the example entry point uses
+        uvloop when installed, which raises frame throughput with no API change.
+
         Args:
             testnet: Use testnet (True) or live (False)
         """
@@ -40,17 +164,40 @@ class BybitWebSocket:
         self.subscribed_channels = set()
 
         # Data storage
+        self._symbol_intern = {}  # raw symbol -> interned str, so per-message keys hash once
         self.tickers = {}
-        self.orderbooks = defaultdict(lambda: {'bids': {}, 'asks': {}})
-        self.trades = defaultdict(list)
-        self.klines = defaultdict(lambda: defaultdict(list))
-
-        # Callbacks
+        # Price-sorted books keyed by integer ticks (bids best-first via negated key):
+        # top-of-book is a slice, converted back to float prices only when published
+        self.orderbooks = defaultdict(lambda: {'bids': SortedDict(neg), 'asks': SortedDict()})
+        self.book_depth = 25
+        self._price_scales = {}  # symbol -> ticks per unit price (1 / tick size)
+        self._top_of_book = {}  # symbol -> OrderbookSnapshot, levels reused until touched
+        self.trades = defaultdict(lambda: deque(maxlen=100))  # Recent trades (last 100)
+        self.klines = defaultdict(lambda: defaultdict(lambda: deque(maxlen=100)))
+
+        # Callbacks (receive Ticker / OrderbookSnapshot / Trade / Kline instances;
+        # use dataclasses.asdict() where a dict is needed)
         self.ticker_callbacks = []
         self.orderbook_callbacks = []
         self.trade_callbacks = []
         self.kline_callbacks = []
 
+        # Parsed events are queued per channel and handed to callbacks by
+        # drain tasks, so a slow callback never stalls the receive loop
+        self._ticker_q = asyncio.Queue(maxsize=10000)
+        self._orderbook_q = asyncio.Queue(maxsize=10000)
+        self._trade_q = asyncio.Queue(maxsize=10000)
+        self._kline_q = asyncio.Queue(maxsize=10000)
+        self._drain_tasks = []
+
+        # Topic prefix -> handler, so routing is one dict lookup per message
+        self._dispatch = {
+            'instrument_info': self._handle_ticker,
+            'orderBook_200': self._handle_orderbook,
+            'trade': self._handle_trade,
+            'klineV2': self._handle_kline
+        }
+
         # Stats
         self.messages_received = 0
         self.last_message_time = None
@@ -65,6 +212,15 @@ class BybitWebSocket:
             self.is_connected = True
             print(f"✅ Connected to Bybit WebSocket")
 
+            # Start callback consumers (once; they survive reconnects)
+            if not self._drain_tasks:
+                self._drain_tasks = [
+                    asyncio.create_task(self._drain(self._ticker_q, self.ticker_callbacks)),
+                    asyncio.create_task(self._drain(self._orderbook_q, self.orderbook_callbacks)),
+                    asyncio.create_task(self._drain(self._trade_q, self.trade_callbacks)),
+                    asyncio.create_task(self._drain(self._kline_q, self.kline_callbacks))
+                ]
+
             # Start message handler
             asyncio.create_task(self._handle_messages())
 
@@ -77,6 +233,10 @@ class BybitWebSocket:
 
     async def disconnect(self):
         """Close WebSocket connection"""
+        for task in self._drain_tasks:
+            task.cancel()
+        self._drain_tasks = []
+
         if self.ws:
             await self.ws.close()
             self.is_connected = False
@@ -92,21 +252,26 @@ class BybitWebSocket:
         for symbol in symbols:
             topic = f"instrument_info.100ms.{symbol}"
             await self._subscribe(topic)
-            self.subscribed_symbols.add(symbol)
+            self.subscribed_symbols.add(self._intern_symbol(symbol))
             print(f"📊 Subscribed to ticker: {symbol}")
 
-    async def subscribe_orderbook(self, symbols: List[str], depth: int = 25):
+    async def subscribe_orderbook(self, symbols: List[str], depth: int = 25,
+                                  tick_sizes: Optional[Dict[str, float]] = None):
         """
         Subscribe to orderbook updates
 
         Args:
             symbols: List of symbols
             depth: Orderbook depth (25, 50, 100, 200)
+            tick_sizes: Optional symbol -> tick size (priceFilter.tickSize from
+                instruments-info); unlisted symbols use a 1e-8 tick
         """
         for symbol in symbols:
+            if tick_sizes and symbol in tick_sizes:
+                self.set_tick_size(symbol, tick_sizes[symbol])
             topic = f"orderBook_200.100ms.{symbol}"
             await self._subscribe(topic)
-            self.subscribed_symbols.add(symbol)
+            self.subscribed_symbols.add(self._intern_symbol(symbol))
             print(f"📖 Subscribed to orderbook: {symbol}")
 
     async def subscribe_trades(self, symbols: List[str]):
@@ -119,7 +284,7 @@ class BybitWebSocket:
         for symbol in symbols:
             topic = f"trade.{symbol}"
             await self._subscribe(topic)
-            self.subscribed_symbols.add(symbol)
+            self.subscribed_symbols.add(self._intern_symbol(symbol))
             print(f"💱 Subscribed to trades: {symbol}")
 
     async def subscribe_klines(self, symbols: List[str], intervals: List[str] = ['1', '3', '5']):
@@ -134,22 +299,37 @@ class BybitWebSocket:
             for interval in intervals:
                 topic = f"klineV2.{interval}.{symbol}"
                 await self._subscribe(topic)
-                self.subscribed_symbols.add(symbol)
+                self.subscribed_symbols.add(self._intern_symbol(symbol))
                 print(f"🕯️ Subscribed to {interval}m klines: {symbol}")
 
+    def _intern_symbol(self, raw: str) -> str:
+        """Return the interned copy of a symbol parsed from a message"""
+        symbol = self._symbol_intern.get(raw)
+        if symbol is None:
+            symbol = self._symbol_intern[raw] = sys.intern(raw)
+        return symbol
+
+    def set_tick_size(self, symbol: str, tick_size: float):
+        """
+        Register a symbol's tick size for orderbook price keys
+
+        Must be set before the symbol's first orderbook frame; keys already
+        stored under another scale are not converted.
+
+        Args:
+            symbol: Trading symbol
+            tick_size: Minimum price increment
+        """
+        self._price_scales[symbol] = round(1 / tick_size)
+
     async def _subscribe(self, topic: str):
         """Send subscription request"""
         if not self.is_connected:
             print("❌ Not connected to WebSocket")
             return
 
-        subscribe_msg = {
-            "op": "subscribe",
-            "args": [topic]
-        }
-
         try:
-            await self.ws.send(json.dumps(subscribe_msg))
+            await self.ws.send(_SUB_TMPL % topic)
             self.subscribed_channels.add(topic)
         except Exception as e:
             print(f"❌ Subscription failed for {topic}: {str(e)}")
@@ -163,27 +343,19 @@ class BybitWebSocket:
                 self.last_message_time = receive_time
 
                 try:
-                    data = json.loads(message)
+                    if MSGSPEC_AVAILABLE:
+                        # Decode the envelope only; payloads are parsed on demand
+                        await self._route_frame(message, receive_time)
+                        continue
+
+                    data = json_loads(message)
 
                     # Handle different message types
                     if 'topic' in data:
-                        topic = data['topic']
-
-                        # Ticker updates
-                        if 'instrument_info' in topic:
-                            await self._handle_ticker(data, receive_time)
-
-                        # Orderbook updates
-                        elif 'orderBook' in topic:
-                            await self._handle_orderbook(data, receive_time)
-
-                        # Trade updates
-                        elif 'trade' in topic:
-                            await self._handle_trade(data, receive_time)
-
-                        # Kline updates
-                        elif 'klineV2' in topic:
-                            await self._handle_kline(data, receive_time)
+                        # Ticker / orderbook / trade / kline updates
+                        handler = self._dispatch.get(data['topic'].split('.', 1)[0])
+                        if handler is not None:
+                            await handler(data, receive_time)
 
                     # Subscription confirmations
                     elif data.get('success'):
@@ -206,36 +378,87 @@ class BybitWebSocket:
             print(f"❌ WebSocket error: {str(e)}")
             self.is_connected = False
 
+    @staticmethod
+    def _publish(queue: asyncio.Queue, event):
+        """Queue an event for its callbacks, dropping the oldest when full"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+    async def _drain(self, queue: asyncio.Queue, callbacks: List[Callable]):
+        """Invoke callbacks for queued events"""
+        while True:
+            event = await queue.get()
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"❌ Callback error: {str(e)}")
+
     async def _handle_ticker(self, data: Dict, receive_time: float):
         """Process ticker updates"""
         try:
             ticker_data = data['data']
-            symbol = ticker_data['symbol']
-
-            # Calculate latency
-            update_time = ticker_data.get('update_time_e6', 0) / 1_000_000
-            latency_ms = (receive_time - update_time) * 1000 if update_time > 0 else 0
-            self.latency_ms = latency_ms
-
-            # Store ticker
-            self.tickers[symbol] = {
-                'symbol': symbol,
-                'last_price': float(ticker_data.get('last_price_e4', 0)) / 10000,
-                'bid': float(ticker_data.get('bid1_price_e4', 0)) / 10000,
-                'ask': float(ticker_data.get('ask1_price_e4', 0)) / 10000,
-                'volume_24h': float(ticker_data.get('volume_24h_e8', 0)) / 100_000_000,
-                'price_change_pct': float(ticker_data.get('price_24h_pcnt_e6', 0)) / 10000,
-                'timestamp': receive_time,
-                'latency_ms': latency_ms
-            }
-
-            # Call callbacks
-            for callback in self.ticker_callbacks:
-                callback(self.tickers[symbol])
+            self._store_ticker(
+                ticker_data['symbol'],
+                float(ticker_data.get('last_price_e4', 0)),
+                float(ticker_data.get('bid1_price_e4', 0)),
+                float(ticker_data.get('ask1_price_e4', 0)),
+                float(ticker_data.get('volume_24h_e8', 0)),
+                float(ticker_data.get('price_24h_pcnt_e6', 0)),
+                float(ticker_data.get('update_time_e6', 0)),
+                receive_time
+            )
 
         except Exception as e:
             print(f"❌ Ticker processing error: {str(e)}")
 
+    def _store_ticker(self, symbol: str, last_e4: float, bid_e4: float, ask_e4: float,
+                      volume_e8: float, pcnt_e6: float, update_e6: float, receive_time: float):
+        """Scale raw ticker fields, store the ticker and hand it to callbacks"""
+        symbol = self._intern_symbol(symbol)
+
+        # Scale fixed-point fields and calculate latency in one compiled call
+        last_price, bid, ask, volume_24h, price_change_pct, latency_ms = _scale_ticker(
+            last_e4, bid_e4, ask_e4, volume_e8, pcnt_e6, update_e6, receive_time
+        )
+        self.latency_ms = latency_ms
+
+        # Store ticker
+        ticker = Ticker(symbol, last_price, bid, ask, volume_24h, price_change_pct,
+                        receive_time, latency_ms)
+        self.tickers[symbol] = ticker
+
+        # Hand off to callbacks
+        self._publish(self._ticker_q, ticker)
+
+    async def _route_frame(self, message, receive_time: float):
+        """Route a frame via its msgspec envelope, decoding the payload only for a known topic"""
+        frame = _envelope_decoder.decode(message)
+        if frame.topic is None:
+            return  # Subscription confirmations / pong responses
+
+        head = frame.topic.split('.', 1)[0]
+
+        # Ticker: decode the payload straight into typed fields
+        if head == 'instrument_info':
+            try:
+                fields = _ticker_decoder.decode(frame.data)
+                self._store_ticker(
+                    fields.symbol, fields.last_price_e4, fields.bid1_price_e4, fields.ask1_price_e4,
+                    fields.volume_24h_e8, fields.price_24h_pcnt_e6, fields.update_time_e6, receive_time
+                )
+            except Exception as e:
+                print(f"❌ Ticker processing error: {str(e)}")
+            return
+
+        handler = self._dispatch.get(head)
+        if handler is not None:
+            data = {'topic': frame.topic}
+            if frame.data:
+                data['data'] = _payload_decoder.decode(frame.data)
+            await handler(data, receive_time)
+
     async def _handle_orderbook(self, data: Dict, receive_time: float):
         """Process orderbook updates"""
         try:
@@ -243,85 +466,98 @@ class BybitWebSocket:
                 return
 
             orderbook_data = data['data']
-            symbol = data['topic'].split('.')[-1]
-
-            # Update orderbook
-            if 'delete' in orderbook_data:
-                # Delete orders
-                for delete_item in orderbook_data['delete']:
-                    price = float(delete_item['price'])
-                    side = delete_item['side']
-                    if side == 'Buy':
-                        self.orderbooks[symbol]['bids'].pop(price, None)
-                    else:
-                        self.orderbooks[symbol]['asks'].pop(price, None)
-
-            if 'update' in orderbook_data:
-                # Update orders
-                for update_item in orderbook_data['update']:
-                    price = float(update_item['price'])
-                    size = float(update_item['size'])
-                    side = update_item['side']
-                    if side == 'Buy':
-                        self.orderbooks[symbol]['bids'][price] = size
-                    else:
-                        self.orderbooks[symbol]['asks'][price] = size
-
-            if 'insert' in orderbook_data:
-                # Insert new orders
-                for insert_item in orderbook_data['insert']:
-                    price = float(insert_item['price'])
-                    size = float(insert_item['size'])
-                    side = insert_item['side']
-                    if side == 'Buy':
-                        self.orderbooks[symbol]['bids'][price] = size
-                    else:
-                        self.orderbooks[symbol]['asks'][price] = size
-
-            # Sort and trim orderbook
-            sorted_bids = sorted(self.orderbooks[symbol]['bids'].items(), reverse=True)[:25]
-            sorted_asks = sorted(self.orderbooks[symbol]['asks'].items())[:25]
-
-            orderbook = {
-                'symbol': symbol,
-                'bids': sorted_bids,
-                'asks': sorted_asks,
-                'timestamp': receive_time
-            }
-
-            # Call callbacks
-            for callback in self.orderbook_callbacks:
-                callback(orderbook)
+            symbol = self._intern_symbol(data['topic'].split('.')[-1])
+
+            book = self.orderbooks[symbol]
+            bids, asks = book['bids'], book['asks']
+            scale = self._price_scales.get(symbol, DEFAULT_PRICE_SCALE)
+            best_bid_changed = None  # Highest changed bid / lowest changed ask price
+            best_ask_changed = None
+
+            # Update orderbook: deletes, then updates, then inserts. Each batch is
+            # converted to integer ticks in one NumPy call and split by side with a mask
+            for action in ('delete', 'update', 'insert'):
+                rows = orderbook_data.get(action)
+                if not rows:
+                    continue
+
+                prices = np.array([row['price'] for row in rows], dtype=np.float64)
+                ticks = np.rint(prices * scale).astype(np.int64)
+                is_bid = np.array([row['side'] == 'Buy' for row in rows])
+                bid_prices = ticks[is_bid]
+                ask_prices = ticks[~is_bid]
+
+                if action == 'delete':
+                    for price in bid_prices.tolist():
+                        bids.pop(price, None)
+                    for price in ask_prices.tolist():
+                        asks.pop(price, None)
+                else:
+                    sizes = np.array([row['size'] for row in rows], dtype=np.float64)
+                    bids.update(zip(bid_prices.tolist(), sizes[is_bid].tolist()))
+                    asks.update(zip(ask_prices.tolist(), sizes[~is_bid].tolist()))
+
+                if bid_prices.size:
+                    top = int(bid_prices.max())
+                    best_bid_changed = top if best_bid_changed is None else max(best_bid_changed, top)
+                if ask_prices.size:
+                    top = int(ask_prices.min())
+                    best_ask_changed = top if best_ask_changed is None else min(best_ask_changed, top)
+
+            # Rebuild a side's top-of-book only when this message touched it
+            top = self._top_of_book.get(symbol)
+            if top is None or self._touches_top(bids, best_bid_changed):
+                top_bids = self._levels(bids, scale)
+            else:
+                top_bids = top.bids
+            if top is None or self._touches_top(asks, best_ask_changed):
+                top_asks = self._levels(asks, scale)
+            else:
+                top_asks = top.asks
+
+            orderbook = OrderbookSnapshot(symbol, top_bids, top_asks, receive_time)
+            self._top_of_book[symbol] = orderbook
+
+            # Hand off to callbacks
+            self._publish(self._orderbook_q, orderbook)
 
         except Exception as e:
             print(f"❌ Orderbook processing error: {str(e)}")
 
+    def _levels(self, side_book: SortedDict, scale: int) -> tuple:
+        """Top levels of one side as (price, size) tuples with prices back in float"""
+        return tuple((ticks / scale, size) for ticks, size in side_book.items()[:self.book_depth])
+
+    def _touches_top(self, side_book: SortedDict, best_changed: Optional[int]) -> bool:
+        """
+        Whether a side's best changed price lies within (or was removed from) its top levels
+
+        Book order is monotonic in price, so checking the best changed tick covers them all.
+        """
+        return best_changed is not None and side_book.bisect_left(best_changed) < self.book_depth
+
     async def _handle_trade(self, data: Dict, receive_time: float):
         """Process trade updates"""
         try:
             if 'data' not in data:
                 return
 
-            symbol = data['topic'].split('.')[-1]
+            symbol = self._intern_symbol(data['topic'].split('.')[-1])
+            trades = data['data']
+
+            # Convert the whole batch's numeric fields at once
+            price_size = np.array([(trade['price'], trade['size']) for trade in trades],
+                                  dtype=np.float64).tolist()
 
-            for trade in data['data']:
-                trade_data = {
-                    'symbol': symbol,
-                    'price': float(trade['price']),
-                    'size': float(trade['size']),
-                    'side': trade['side'],
-                    'timestamp': receive_time,
-                    'trade_time': trade.get('trade_time_ms', 0) / 1000
-                }
+            for trade, (price, size) in zip(trades, price_size):
+                trade_data = Trade(symbol, price, size, trade['side'], receive_time,
+                                   trade.get('trade_time_ms', 0) / 1000)
 
-                # Store recent trades (keep last 100)
+                # Store recent trades (deque keeps last 100)
                 self.trades[symbol].append(trade_data)
-                if len(self.trades[symbol]) > 100:
-                    self.trades[symbol] = self.trades[symbol][-100:]
 
-                # Call callbacks
-                for callback in self.trade_callbacks:
-                    callback(trade_data)
+                # Hand off to callbacks
+                self._publish(self._trade_q, trade_data)
 
         except Exception as e:
             print(f"❌ Trade processing error: {str(e)}")
@@ -335,29 +571,23 @@ class BybitWebSocket:
             topic = data['topic']
             parts = topic.split('.')
             interval = parts[1]
-            symbol = parts[2]
-
-            for kline in data['data']:
-                kline_data = {
-                    'symbol': symbol,
-                    'interval': interval,
-                    'open': float(kline['open']),
-                    'high': float(kline['high']),
-                    'low': float(kline['low']),
-                    'close': float(kline['close']),
-                    'volume': float(kline['volume']),
-                    'timestamp': kline['start'],
-                    'confirmed': kline.get('confirm', False)
-                }
-
-                # Store kline
+            symbol = self._intern_symbol(parts[2])
+
+            klines = data['data']
+
+            # Convert the whole batch's OHLCV at once
+            ohlcv = np.array([(k['open'], k['high'], k['low'], k['close'], k['volume']) for k in klines],
+                             dtype=np.float64).tolist()
+
+            for kline, (open_, high, low, close, volume) in zip(klines, ohlcv):
+                kline_data = Kline(symbol, interval, open_, high, low, close, volume,
+                                   kline['start'], kline.get('confirm', False))
+
+                # Store kline (deque keeps last 100)
                 self.klines[symbol][interval].append(kline_data)
-                if len(self.klines[symbol][interval]) > 100:
-                    self.klines[symbol][interval] = self.klines[symbol][interval][-100:]
 
-                # Call callbacks
-                for callback in self.kline_callbacks:
-                    callback(kline_data)
+                # Hand off to callbacks
+                self._publish(self._kline_q, kline_data)
 
         except Exception as e:
             print(f"❌ Kline processing error: {str(e)}")
@@ -385,18 +615,23 @@ class BybitWebSocket:
                     interval = parts[1]
                     await self.subscribe_klines(symbols, [interval])
 
-    def get_ticker(self, symbol: str) -> Optional[Dict]:
+    def get_ticker(self, symbol: str) -> Optional[Ticker]:
         """Get latest ticker data"""
         return self.tickers.get(symbol)
 
-    def get_orderbook(self, symbol: str) -> Optional[Dict]:
+    def get_orderbook(self, symbol: str) -> Optional[OrderbookSnapshot]:
         """Get latest orderbook data"""
+        top = self._top_of_book.get(symbol)
+        if top is not None:
+            return top
         if symbol in self.orderbooks:
-            return {
-                'symbol': symbol,
-                'bids': sorted(self.orderbooks[symbol]['bids'].items(), reverse=True)[:25],
-                'asks': sorted(self.orderbooks[symbol]['asks'].items())[:25]
-            }
+            scale = self._price_scales.get(symbol, DEFAULT_PRICE_SCALE)
+            return OrderbookSnapshot(
+                symbol,
+                self._levels(self.orderbooks[symbol]['bids'], scale),
+                self._levels(self.orderbooks[symbol]['asks'], scale),
+                None
+            )
         return None
 
     def get_stats(self) -> Dict:
@@ -440,9 +675,13 @@ if __name__ == '__main__':
         for symbol in symbols:
             ticker = ws.get_ticker(symbol)
             if ticker:
-                print(f"\n💰 {symbol}: ${ticker['last_price']:,.2f}")
+                print(f"\n💰 {symbol}: ${ticker.last_price:,.2f}")
 
         # Disconnect
         await ws.disconnect()
 
-    asyncio.run(main())
+    # Run on uvloop when installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
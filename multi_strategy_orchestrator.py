@@ -12,13 +12,23 @@ Architecture:
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 import numpy as np
 from collections import defaultdict
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -40,6 +50,105 @@ class StrategyStatus(Enum):
     ERROR = "error"
 
 
+# Fixed StrategyType -> array slot table for the per-strategy arrays
+STRATEGY_TYPES = tuple(StrategyType)
+STRATEGY_INDEX = {strategy_type: i for i, strategy_type in enumerate(STRATEGY_TYPES)}
+
+TAKER_FEE = 0.0004  # Per side
+RAND_BATCH = 4096  # Uniforms drawn per refill of the trade RNG buffer
+RETURNS_CAPACITY = 32  # Initial days of per-strategy daily returns (doubles when full)
+
+
+@njit('Tuple((f8, f8, f8, f8, f8, b1))(f8, f8, f8, f8, f8, f8, f8, f8)', cache=True)
+def _simulate_trade(allocated, leverage, entry_price, win_rate, avg_profit, avg_loss, fee_rate, u):
+    """
+    Size a trade and estimate its P&L from one uniform draw u in [0, 1)
+
+    Returns: (quantity, position_value, gross_pnl, fees, net_pnl, is_win)
+    """
+    position_value = allocated * leverage
+    quantity = position_value / entry_price
+
+    is_win = u < win_rate
+    pnl_pct = avg_profit if is_win else -avg_loss
+
+    # P&L with leverage, less entry + exit fees
+    gross_pnl = position_value * pnl_pct
+    fees = position_value * fee_rate * 2
+
+    # Plain floats/bool also when running uncompiled on NumPy scalar inputs
+    return (float(quantity), float(position_value), float(gross_pnl), float(fees),
+            float(gross_pnl - fees), bool(is_win))
+
+
+@njit(cache=True)
+def _simulate_batch(start, strategies, confidence, prices, uniforms, active,
+                    min_conf, max_pos, leverage, win_rate, avg_profit, avg_loss, fee_rate,
+                    allocated, allocated_inv, positions,
+                    total_trades, winning_trades, losing_trades, total_pnl, daily_pnl,
+                    state, limits, out_pnl, out_win, out_executed):
+    """
+    Run signals from `start` through the same checks and P&L as execute_trade
+
+    Per-strategy arrays are updated in place. state holds
+    [capital, peak, daily_pnl, total_pnl, daily_start_capital] and limits holds
+    [max_daily_loss, max_drawdown, max_strategy_loss].
+
+    Returns: index after the last signal processed; stops early right after a
+    trade that leaves a risk limit for _check_risk_limits to act on
+    """
+    n = strategies.shape[0]
+    n_strategies = allocated.shape[0]
+
+    for t in range(start, n):
+        i = strategies[t]
+        if not active[i] or confidence[t] < min_conf[i] or positions[i] >= max_pos[i] or allocated[i] <= 0:
+            continue
+
+        trade = _simulate_trade(allocated[i], leverage[i], prices[t], win_rate[i],
+                                avg_profit[i], avg_loss[i], fee_rate, uniforms[t])
+        net_pnl = trade[4]
+        is_win = trade[5]
+        out_pnl[t] = net_pnl
+        out_win[t] = is_win
+        out_executed[t] = True
+
+        state[0] += net_pnl
+        state[3] += net_pnl
+        state[2] += net_pnl
+        total_trades[i] += 1
+        total_pnl[i] += net_pnl
+        daily_pnl[i] += net_pnl
+        if is_win:
+            winning_trades[i] += 1
+        else:
+            losing_trades[i] += 1
+        if state[0] > state[1]:
+            state[1] = state[0]
+
+        # Same limits as _check_risk_limits: hand control back if any would act
+        if abs(min(0.0, state[2])) / state[4] >= limits[0]:
+            return t + 1
+        if (state[1] - state[0]) / state[1] >= limits[1]:
+            return t + 1
+        for j in range(n_strategies):
+            if max(-daily_pnl[j], 0.0) * allocated_inv[j] >= limits[2]:
+                return t + 1
+            if (active[j] and total_trades[j] >= 10
+                    and winning_trades[j] / total_trades[j] < win_rate[j] - 0.15):
+                return t + 1
+
+    return n
+
+
+def _ns_to_dt(ns: Optional[int]) -> Optional[datetime]:
+    """Convert a time.monotonic_ns() stamp to a wall-clock datetime (None passes through)"""
+    if ns is None:
+        return None
+    # Anchor on the clocks as read now, so NTP steps and suspend don't accumulate drift
+    return datetime.now() - timedelta(microseconds=(time.monotonic_ns() - ns) // 1000)
+
+
 @dataclass
 class StrategyConfig:
     """Configuration for each trading strategy"""
@@ -59,38 +168,106 @@ class StrategyConfig:
     status: StrategyStatus = StrategyStatus.ACTIVE
 
 
+class PerformanceArrays:
+    """
+    Real-time performance counters for all strategies as parallel arrays
+
+    Slot i belongs to STRATEGY_TYPES[i], so cross-strategy checks are single
+    vector operations instead of a loop over per-strategy objects.
+    """
+
+    def __init__(self, n: int = len(STRATEGY_TYPES)):
+        self.total_trades = np.zeros(n, dtype=np.int64)
+        self.winning_trades = np.zeros(n, dtype=np.int64)
+        self.losing_trades = np.zeros(n, dtype=np.int64)
+        self.current_positions = np.zeros(n, dtype=np.int64)
+        self.total_pnl = np.zeros(n, dtype=np.float64)
+        self.daily_pnl = np.zeros(n, dtype=np.float64)
+        self.allocated = np.zeros(n, dtype=np.float64)
+        self.allocated_inv = np.zeros(n, dtype=np.float64)  # 1 / allocated, refreshed on allocation
+
+        # Daily returns, one row per strategy; columns [:n_days] are filled
+        self.daily_returns = np.zeros((n, RETURNS_CAPACITY), dtype=np.float32)
+        self.n_days = 0
+
+    def append_daily_returns(self, returns: np.ndarray):
+        """Record one day's return for every strategy"""
+        if self.n_days == self.daily_returns.shape[1]:
+            grown = np.zeros((self.daily_returns.shape[0], 2 * self.n_days), dtype=np.float32)
+            grown[:, :self.n_days] = self.daily_returns
+            self.daily_returns = grown
+        self.daily_returns[:, self.n_days] = returns
+        self.n_days += 1
+
+    def update(self, i: int, trade_pnl: float, is_win: bool):
+        """Update slot i after a trade"""
+        self.total_trades[i] += 1
+        self.total_pnl[i] += trade_pnl
+        self.daily_pnl[i] += trade_pnl
+
+        if is_win:
+            self.winning_trades[i] += 1
+        else:
+            self.losing_trades[i] += 1
+
+
 @dataclass
 class StrategyPerformance:
-    """Real-time performance metrics for each strategy"""
+    """Real-time performance metrics for one strategy (a view onto its PerformanceArrays slot)"""
     strategy_type: StrategyType
-    total_trades: int = 0
-    winning_trades: int = 0
-    losing_trades: int = 0
-    total_pnl: float = 0.0
-    daily_pnl: float = 0.0
-    current_positions: int = 0
-    actual_win_rate: float = 0.0
+    arrays: PerformanceArrays
     sharpe_ratio: float = 0.0
     max_drawdown: float = 0.0
-    last_trade_time: Optional[datetime] = None
-    daily_returns: List[float] = field(default_factory=list)
+    last_trade_ns: Optional[int] = None  # time.monotonic_ns() of the last trade
 
-    def update(self, trade_pnl: float, is_win: bool):
-        """Update performance metrics after a trade"""
-        self.total_trades += 1
-        self.total_pnl += trade_pnl
-        self.daily_pnl += trade_pnl
+    @property
+    def index(self) -> int:
+        return STRATEGY_INDEX[self.strategy_type]
 
-        if is_win:
-            self.winning_trades += 1
-        else:
-            self.losing_trades += 1
+    @property
+    def total_trades(self) -> int:
+        return int(self.arrays.total_trades[self.index])
+
+    @property
+    def winning_trades(self) -> int:
+        return int(self.arrays.winning_trades[self.index])
 
-        # Update win rate
-        if self.total_trades > 0:
-            self.actual_win_rate = self.winning_trades / self.total_trades
+    @property
+    def losing_trades(self) -> int:
+        return int(self.arrays.losing_trades[self.index])
 
-        self.last_trade_time = datetime.now()
+    @property
+    def current_positions(self) -> int:
+        return int(self.arrays.current_positions[self.index])
+
+    @property
+    def total_pnl(self) -> float:
+        return float(self.arrays.total_pnl[self.index])
+
+    @property
+    def daily_pnl(self) -> float:
+        return float(self.arrays.daily_pnl[self.index])
+
+    @property
+    def actual_win_rate(self) -> float:
+        """Win rate computed on read, so trades only bump counters"""
+        total = self.arrays.total_trades[self.index]
+        return float(self.arrays.winning_trades[self.index] / total) if total else 0.0
+
+    @property
+    def daily_returns(self) -> List[float]:
+        """Recorded daily returns (fraction of daily starting capital)"""
+        return self.arrays.daily_returns[self.index, :self.arrays.n_days].tolist()
+
+    @property
+    def last_trade_time(self) -> Optional[datetime]:
+        """Wall-clock time of the last trade (converted on read)"""
+        return _ns_to_dt(self.last_trade_ns)
+
+    def update(self, trade_pnl: float, is_win: bool, timestamp_ns: Optional[int] = None):
+        """Update performance metrics after a trade"""
+        self.arrays.update(self.index, trade_pnl, is_win)
+        self.last_trade_ns = time.monotonic_ns() if timestamp_ns is None else timestamp_ns
 
 
 @dataclass
@@ -106,26 +283,33 @@ class CircuitBreaker:
     trigger_time: Optional[datetime] = None
 
     def check(self, daily_loss_pct: float, total_drawdown_pct: float,
-              strategy_losses: Dict[StrategyType, float]) -> bool:
-        """Check if circuit breaker should trigger"""
+              strategy_losses: np.ndarray) -> bool:
+        """
+        Check if circuit breaker should trigger
 
-        # Check daily loss limit
-        if daily_loss_pct >= self.max_daily_loss_pct:
-            self.trigger(f"Daily loss {daily_loss_pct*100:.1f}% exceeds limit {self.max_daily_loss_pct*100:.1f}%")
-            return True
+        Args:
+            daily_loss_pct: Today's loss as a fraction of starting capital
+            total_drawdown_pct: Drawdown from peak capital
+            strategy_losses: Per-strategy daily loss fraction, indexed like STRATEGY_TYPES
+        """
+        # Evaluate every limit up front; the common no-trigger path builds no messages
+        daily_hit = daily_loss_pct >= self.max_daily_loss_pct
+        drawdown_hit = total_drawdown_pct >= self.max_total_drawdown_pct
+        strategy_hits = strategy_losses >= self.max_strategy_loss_pct
 
-        # Check total drawdown
-        if total_drawdown_pct >= self.max_total_drawdown_pct:
-            self.trigger(f"Total drawdown {total_drawdown_pct*100:.1f}% exceeds limit {self.max_total_drawdown_pct*100:.1f}%")
-            return True
+        if not (daily_hit or drawdown_hit or strategy_hits.any()):
+            return False
 
-        # Check individual strategy losses
-        for strategy_type, loss_pct in strategy_losses.items():
-            if loss_pct >= self.max_strategy_loss_pct:
-                self.trigger(f"Strategy {strategy_type.value} loss {loss_pct*100:.1f}% exceeds limit")
-                return True
+        # Report the first limit hit: daily loss, then drawdown, then strategies in order
+        if daily_hit:
+            self.trigger(f"Daily loss {daily_loss_pct*100:.1f}% exceeds limit {self.max_daily_loss_pct*100:.1f}%")
+        elif drawdown_hit:
+            self.trigger(f"Total drawdown {total_drawdown_pct*100:.1f}% exceeds limit {self.max_total_drawdown_pct*100:.1f}%")
+        else:
+            i = int(strategy_hits.argmax())
+            self.trigger(f"Strategy {STRATEGY_TYPES[i].value} loss {strategy_losses[i]*100:.1f}% exceeds limit")
 
-        return False
+        return True
 
     def trigger(self, reason: str):
         """Trigger circuit breaker"""
@@ -154,18 +338,26 @@ class MultiStrategyOrchestrator:
     - Grid Trading: 0.8% daily
     """
 
-    def __init__(self, initial_capital: float = 500, enable_live_trading: bool = False):
+    def __init__(self, initial_capital: float = 500, enable_live_trading: bool = False,
+                 seed: Optional[int] = None):
         self.initial_capital = initial_capital
         self.current_capital = initial_capital
         self.peak_capital = initial_capital
         self.enable_live_trading = enable_live_trading
 
+        # Trade outcomes draw from a pre-generated batch of uniforms (refilled when used up)
+        self._rng = np.random.default_rng(seed)
+        self._rand_buf = self._rng.random(RAND_BATCH).tolist()
+        self._rand_i = 0
+
         # Strategy configurations
         self.strategies: Dict[StrategyType, StrategyConfig] = self._initialize_strategies()
+        self.refresh_config_arrays()
 
-        # Performance tracking
+        # Performance tracking: counters live in one set of arrays, viewed per strategy
+        self._perf = PerformanceArrays()
         self.performance: Dict[StrategyType, StrategyPerformance] = {
-            strategy_type: StrategyPerformance(strategy_type=strategy_type)
+            strategy_type: StrategyPerformance(strategy_type=strategy_type, arrays=self._perf)
             for strategy_type in StrategyType
         }
 
@@ -176,16 +368,21 @@ class MultiStrategyOrchestrator:
         self.allocated_capital: Dict[StrategyType, float] = {}
         self._allocate_capital()
 
-        # Correlation tracking
-        self.correlation_matrix: Dict[tuple, float] = {}
+        # Correlation tracking: daily-return correlations, indexed like STRATEGY_TYPES
+        self.correlation_matrix = np.zeros((len(STRATEGY_TYPES), len(STRATEGY_TYPES)), dtype=np.float32)
 
         # Global metrics
         self.total_trades = 0
         self.total_pnl = 0.0
         self.daily_pnl = 0.0
         self.start_time = datetime.now()
+        self._start_ns = time.monotonic_ns()
         self.daily_start_capital = initial_capital
 
+        # Monthly projection, recomputed only when (daily_pnl, daily_start_capital) changes
+        self._projection_key = None
+        self._monthly_projection = 0
+
         logger.info(f"🚀 Multi-Strategy Orchestrator initialized with ${initial_capital:,.2f} capital")
 
     def _initialize_strategies(self) -> Dict[StrategyType, StrategyConfig]:
@@ -267,18 +464,48 @@ class MultiStrategyOrchestrator:
             )
         }
 
+    def refresh_config_arrays(self):
+        """
+        Mirror numeric strategy config fields into arrays indexed like STRATEGY_TYPES
+
+        Hot paths read these instead of the StrategyConfig objects; call again
+        after editing a config's numeric fields. Status stays on the config.
+        """
+        configs = [self.strategies[st] for st in STRATEGY_TYPES]
+        self._cfg_leverage = np.array([c.leverage for c in configs], dtype=np.float64)
+        self._cfg_min_conf = np.array([c.min_confidence for c in configs], dtype=np.float64)
+        self._cfg_max_pos = np.array([c.max_positions for c in configs], dtype=np.int32)
+        self._cfg_win_rate = np.array([c.win_rate for c in configs], dtype=np.float64)
+        self._cfg_profit = np.array([c.avg_profit_per_trade for c in configs], dtype=np.float64)
+        self._cfg_loss = np.array([c.avg_loss_per_trade for c in configs], dtype=np.float64)
+
     def _allocate_capital(self):
         """Allocate capital to each strategy based on position size percentages"""
         total_allocation = sum(s.position_size_pct for s in self.strategies.values())
+        log_allocations = logger.isEnabledFor(logging.INFO)
 
         for strategy_type, config in self.strategies.items():
             # Allocate based on strategy's position size percentage
             allocated = self.current_capital * config.position_size_pct
             self.allocated_capital[strategy_type] = allocated
+            self._perf.allocated[STRATEGY_INDEX[strategy_type]] = allocated
+
+            if log_allocations:
+                logger.info(f"  {config.name}: ${allocated:,.2f} ({config.position_size_pct*100:.0f}%)")
 
-            logger.info(f"  {config.name}: ${allocated:,.2f} ({config.position_size_pct*100:.0f}%)")
+        # Risk checks multiply by the reciprocal instead of dividing on every trade
+        self._perf.allocated_inv[:] = np.reciprocal(self._perf.allocated)
 
-        logger.info(f"Total allocated: {total_allocation*100:.0f}% of capital")
+        logger.info("Total allocated: %.0f%% of capital", total_allocation * 100)
+
+    def _rand(self) -> float:
+        """Next uniform in [0, 1) from the pre-generated batch"""
+        i = self._rand_i
+        if i == RAND_BATCH:
+            self._rand_buf = self._rng.random(RAND_BATCH).tolist()
+            i = 0
+        self._rand_i = i + 1
+        return self._rand_buf[i]
 
     def can_trade(self, strategy_type: StrategyType, signal_confidence: float) -> tuple[bool, str]:
         """
@@ -292,21 +519,22 @@ class MultiStrategyOrchestrator:
             return False, f"Circuit breaker active: {self.circuit_breaker.trigger_reason}"
 
         # Check strategy status
-        config = self.strategies[strategy_type]
-        if config.status != StrategyStatus.ACTIVE:
-            return False, f"Strategy status: {config.status.value}"
+        status = self.strategies[strategy_type].status
+        if status != StrategyStatus.ACTIVE:
+            return False, f"Strategy status: {status.value}"
+
+        i = STRATEGY_INDEX[strategy_type]
 
         # Check confidence threshold
-        if signal_confidence < config.min_confidence:
-            return False, f"Confidence {signal_confidence:.2%} below min {config.min_confidence:.2%}"
+        if signal_confidence < self._cfg_min_conf[i]:
+            return False, f"Confidence {signal_confidence:.2%} below min {self._cfg_min_conf[i]:.2%}"
 
         # Check max positions
-        performance = self.performance[strategy_type]
-        if performance.current_positions >= config.max_positions:
-            return False, f"Max positions ({config.max_positions}) reached"
+        if self._perf.current_positions[i] >= self._cfg_max_pos[i]:
+            return False, f"Max positions ({self._cfg_max_pos[i]}) reached"
 
         # Check allocated capital
-        if self.allocated_capital[strategy_type] <= 0:
+        if self._perf.allocated[i] <= 0:
             return False, "No allocated capital"
 
         return True, "OK"
@@ -325,38 +553,27 @@ class MultiStrategyOrchestrator:
         # Check if can trade
         can_trade, reason = self.can_trade(strategy_type, signal_confidence)
         if not can_trade:
-            logger.debug(f"❌ {strategy_type.value} trade rejected: {reason}")
+            logger.debug("❌ %s trade rejected: %s", strategy_type.value, reason)
             return None
 
         config = self.strategies[strategy_type]
+        i = STRATEGY_INDEX[strategy_type]
 
-        # Calculate position size
+        # Size the trade and estimate P&L (simplified) in one compiled call
         allocated = self.allocated_capital[strategy_type]
-        position_value = allocated * config.leverage
-        quantity = position_value / entry_price
-
-        # Estimate P&L (simplified)
-        is_win = np.random.random() < config.win_rate
-        if is_win:
-            pnl_pct = config.avg_profit_per_trade
-        else:
-            pnl_pct = -config.avg_loss_per_trade
-
-        # Calculate actual P&L with leverage
-        gross_pnl = position_value * pnl_pct
-
-        # Fees (0.04% taker fee * 2 for entry/exit)
-        fees = position_value * 0.0004 * 2
-
-        net_pnl = gross_pnl - fees
+        quantity, position_value, gross_pnl, fees, net_pnl, is_win = _simulate_trade(
+            allocated, self._cfg_leverage[i], entry_price, self._cfg_win_rate[i],
+            self._cfg_profit[i], self._cfg_loss[i], TAKER_FEE, self._rand()
+        )
 
         # Update capital
         self.current_capital += net_pnl
         self.total_pnl += net_pnl
         self.daily_pnl += net_pnl
 
-        # Update strategy performance
-        self.performance[strategy_type].update(net_pnl, is_win)
+        # Update strategy performance (one monotonic stamp serves the result too)
+        timestamp_ns = time.monotonic_ns()
+        self.performance[strategy_type].update(net_pnl, is_win, timestamp_ns)
 
         # Update global metrics
         self.total_trades += 1
@@ -381,16 +598,76 @@ class MultiStrategyOrchestrator:
             'pnl_pct': (net_pnl / allocated) * 100,
             'is_win': is_win,
             'fees': fees,
-            'timestamp': datetime.now(),
+            'timestamp_ns': timestamp_ns,  # time.monotonic_ns(); see _ns_to_dt
             'current_capital': self.current_capital
         }
 
-        result_emoji = "✅" if is_win else "❌"
-        logger.info(f"{result_emoji} {config.name}: {side} {quantity:.4f} {symbol} @ ${entry_price:,.2f} | "
-                   f"PnL: ${net_pnl:+.2f} | Balance: ${self.current_capital:,.2f}")
+        # Only format the trade line when INFO is actually emitted (%-style can't do thousands separators)
+        if logger.isEnabledFor(logging.INFO):
+            result_emoji = "✅" if is_win else "❌"
+            logger.info(f"{result_emoji} {config.name}: {side} {quantity:.4f} {symbol} @ ${entry_price:,.2f} | "
+                        f"PnL: ${net_pnl:+.2f} | Balance: ${self.current_capital:,.2f}")
 
         return trade_result
 
+    def simulate_trades(self, strategy_idx: np.ndarray, confidence: np.ndarray,
+                        prices: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Simulate a batch of signals in one compiled loop
+
+        Applies the same checks, P&L and risk limits as calling execute_trade per
+        signal, dropping back to Python only where _check_risk_limits has to act.
+        Per-trade logging is skipped.
+
+        Args:
+            strategy_idx: Strategy per signal (index into STRATEGY_TYPES)
+            confidence: Signal confidence per signal
+            prices: Entry price per signal
+
+        Returns:
+            {'executed': bool, 'pnl': float, 'is_win': bool} arrays, one entry per signal
+        """
+        strategy_idx = np.ascontiguousarray(strategy_idx, dtype=np.int64)
+        confidence = np.ascontiguousarray(confidence, dtype=np.float64)
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        n = len(strategy_idx)
+
+        uniforms = self._rng.random(n)
+        pnl = np.zeros(n, dtype=np.float64)
+        is_win = np.zeros(n, dtype=np.bool_)
+        executed = np.zeros(n, dtype=np.bool_)
+
+        perf = self._perf
+        breaker = self.circuit_breaker
+        limits = np.array([breaker.max_daily_loss_pct, breaker.max_total_drawdown_pct,
+                           breaker.max_strategy_loss_pct])
+
+        start = 0
+        while start < n and not breaker.is_triggered:
+            active = np.array([self.strategies[st].status == StrategyStatus.ACTIVE for st in STRATEGY_TYPES])
+            state = np.array([self.current_capital, self.peak_capital, self.daily_pnl,
+                              self.total_pnl, self.daily_start_capital])
+
+            start = _simulate_batch(
+                start, strategy_idx, confidence, prices, uniforms, active,
+                self._cfg_min_conf, self._cfg_max_pos, self._cfg_leverage, self._cfg_win_rate,
+                self._cfg_profit, self._cfg_loss, TAKER_FEE,
+                perf.allocated, perf.allocated_inv, perf.current_positions,
+                perf.total_trades, perf.winning_trades, perf.losing_trades, perf.total_pnl, perf.daily_pnl,
+                state, limits, pnl, is_win, executed
+            )
+
+            self.current_capital, self.peak_capital, self.daily_pnl, self.total_pnl = state[:4].tolist()
+            self._check_risk_limits()
+
+        # Global metrics
+        self.total_trades += int(executed.sum())
+        now_ns = time.monotonic_ns()
+        for i in np.unique(strategy_idx[executed]):
+            self.performance[STRATEGY_TYPES[i]].last_trade_ns = now_ns
+
+        return {'executed': executed, 'pnl': pnl, 'is_win': is_win}
+
     def _check_risk_limits(self):
         """Check risk limits and trigger circuit breaker if needed"""
 
@@ -400,35 +677,45 @@ class MultiStrategyOrchestrator:
         # Calculate total drawdown
         total_drawdown_pct = (self.peak_capital - self.current_capital) / self.peak_capital
 
-        # Calculate per-strategy losses
-        strategy_losses = {}
-        for strategy_type, perf in self.performance.items():
-            if perf.daily_pnl < 0:
-                strategy_losses[strategy_type] = abs(perf.daily_pnl) / self.allocated_capital[strategy_type]
+        # Calculate per-strategy losses (fraction of allocated capital) for all strategies at once
+        perf = self._perf
+        losses = np.maximum(-perf.daily_pnl, 0.0) * perf.allocated_inv
 
         # Check circuit breaker
-        self.circuit_breaker.check(daily_loss_pct, total_drawdown_pct, strategy_losses)
-
-        # Pause underperforming strategies
-        for strategy_type, perf in self.performance.items():
-            if perf.total_trades >= 10:  # Need minimum trades
-                # Pause if win rate drops >15% below target
-                expected_wr = self.strategies[strategy_type].win_rate
-                if perf.actual_win_rate < (expected_wr - 0.15):
-                    self.strategies[strategy_type].status = StrategyStatus.PAUSED
-                    logger.warning(f"⏸️ Pausing {strategy_type.value}: win rate {perf.actual_win_rate:.1%} vs expected {expected_wr:.1%}")
+        self.circuit_breaker.check(daily_loss_pct, total_drawdown_pct, losses)
+
+        # Pause underperforming strategies: win rate >15% below target after a minimum of 10 trades
+        win_rates = perf.winning_trades / np.maximum(perf.total_trades, 1)
+        lagging = (perf.total_trades >= 10) & (win_rates < self._cfg_win_rate - 0.15)
+        for i in np.flatnonzero(lagging):
+            strategy_type = STRATEGY_TYPES[i]
+            expected_wr = self._cfg_win_rate[i]
+            self.strategies[strategy_type].status = StrategyStatus.PAUSED
+            logger.warning("⏸️ Pausing %s: win rate %.1f%% vs expected %.1f%%",
+                           strategy_type.value, win_rates[i] * 100, expected_wr * 100)
 
     def reset_daily_metrics(self):
         """Reset daily metrics at start of new day"""
         self.daily_pnl = 0.0
         self.daily_start_capital = self.current_capital
 
-        for perf in self.performance.values():
-            perf.daily_returns.append(perf.daily_pnl / self.daily_start_capital)
-            perf.daily_pnl = 0.0
+        self._perf.append_daily_returns(self._perf.daily_pnl / self.daily_start_capital)
+        self._perf.daily_pnl[:] = 0.0
+        self._update_correlation()
 
         logger.info(f"📅 Daily metrics reset. Starting capital: ${self.current_capital:,.2f}")
 
+    def _update_correlation(self):
+        """Recompute cross-strategy correlation of daily returns"""
+        n_days = self._perf.n_days
+        if n_days < 2:
+            return
+
+        # Strategies with flat returns have no defined correlation; report 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.corrcoef(self._perf.daily_returns[:, :n_days])
+        self.correlation_matrix = np.nan_to_num(corr, nan=0.0).astype(np.float32)
+
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
 
@@ -436,7 +723,23 @@ class MultiStrategyOrchestrator:
         total_return_pct = ((self.current_capital - self.initial_capital) / self.initial_capital) * 100
         daily_return_pct = (self.daily_pnl / self.daily_start_capital) * 100
 
-        elapsed_days = (datetime.now() - self.start_time).total_seconds() / 86400
+        projection_key = (self.daily_pnl, self.daily_start_capital)
+        if projection_key != self._projection_key:
+            self._projection_key = projection_key
+            self._monthly_projection = ((1 + daily_return_pct/100) ** 30 - 1) * 100 if daily_return_pct > 0 else 0
+
+        now_ns = time.monotonic_ns()
+        elapsed_days = (now_ns - self._start_ns) / 86_400_000_000_000
+
+        # Per-strategy figures: one reduction / conversion per array
+        perf = self._perf
+        total_wins = int(perf.winning_trades.sum())
+        total_losses = int(perf.losing_trades.sum())
+        trades = perf.total_trades.tolist()
+        win_rates = (perf.winning_trades / np.maximum(perf.total_trades, 1)).tolist()
+        pnls = perf.total_pnl.tolist()
+        daily_pnls = perf.daily_pnl.tolist()
+        allocated = perf.allocated.tolist()
 
         return {
             'timestamp': datetime.now(),
@@ -451,21 +754,21 @@ class MultiStrategyOrchestrator:
             },
             'trades': {
                 'total': self.total_trades,
-                'total_wins': sum(p.winning_trades for p in self.performance.values()),
-                'total_losses': sum(p.losing_trades for p in self.performance.values()),
-                'overall_win_rate': sum(p.winning_trades for p in self.performance.values()) / max(1, self.total_trades)
+                'total_wins': total_wins,
+                'total_losses': total_losses,
+                'overall_win_rate': total_wins / max(1, self.total_trades)
             },
             'strategies': {
                 strategy_type.value: {
-                    'status': config.status.value,
-                    'trades': perf.total_trades,
-                    'win_rate': perf.actual_win_rate,
-                    'pnl': perf.total_pnl,
-                    'daily_pnl': perf.daily_pnl,
-                    'allocated_capital': self.allocated_capital[strategy_type]
+                    'status': self.strategies[strategy_type].status.value,
+                    'trades': trades[i],
+                    'win_rate': win_rates[i],
+                    'pnl': pnls[i],
+                    'daily_pnl': daily_pnls[i],
+                    'allocated_capital': allocated[i],
+                    'last_trade_time': _ns_to_dt(self.performance[strategy_type].last_trade_ns)
                 }
-                for strategy_type, (config, perf) in
-                zip(self.strategies.keys(), zip(self.strategies.values(), self.performance.values()))
+                for i, strategy_type in enumerate(STRATEGY_TYPES)
             },
             'risk': {
                 'circuit_breaker_active': self.circuit_breaker.is_triggered,
@@ -477,7 +780,7 @@ class MultiStrategyOrchestrator:
                 'daily_progress_pct': daily_return_pct,
                 'on_track': daily_return_pct >= 6.39,
                 'elapsed_days': elapsed_days,
-                'monthly_projection': ((1 + daily_return_pct/100) ** 30 - 1) * 100 if daily_return_pct > 0 else 0
+                'monthly_projection': self._monthly_projection
             }
         }
 
@@ -526,18 +829,18 @@ class MultiStrategyOrchestrator:
 if __name__ == '__main__':
     # Test the orchestrator
     orchestrator = MultiStrategyOrchestrator(initial_capital=500)
+    rng = np.random.default_rng()
 
     print("\n🧪 Testing Multi-Strategy Orchestrator\n")
 
-    # Simulate some trades
-    for i in range(20):
-        # Random strategy
-        strategy = np.random.choice(list(StrategyType))
-        confidence = np.random.uniform(0.65, 0.95)
-        price = np.random.uniform(40000, 45000)
-        side = np.random.choice(['long', 'short'])
+    # Simulate some trades: draw all signals up front, run them in one batch
+    n_signals = 20
+    strategies = rng.integers(0, len(STRATEGY_TYPES), n_signals)
+    confidence = rng.uniform(0.65, 0.95, n_signals)
+    prices = rng.uniform(40000, 45000, n_signals)
 
-        result = orchestrator.execute_trade(strategy, confidence, price, side)
+    result = orchestrator.simulate_trades(strategies, confidence, prices)
+    print(f"Executed {int(result['executed'].sum())} of {n_signals} signals\n")
 
     # Print status
     orchestrator.print_status()
@@ -442,6 +442,8 @@ class NuclearSwarmOrchestrator:
                 'utilization_pct': (len(self.active_positions) / self.max_concurrent_positions) * 100,
                 'total_opened': self.total_positions_opened,
                 'total_closed': self.total_positions_closed,
+                'total_wins': self.winning_positions,
+                'total_losses': self.losing_positions,
                 'win_rate': win_rate
             },
             'opportunities': {